@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-from collections import deque
 from typing import cast
 
 import click
@@ -329,7 +328,7 @@ def daemon_run(ctx: click.Context, interval: int) -> None:
 def logs(ctx: click.Context, lines: int, follow: bool, errors: bool, use_json: bool) -> None:
     import time
 
-    from syke.daemon.daemon import LOG_PATH
+    from syke.daemon.daemon import LOG_PATH, _tail
 
     if use_json and follow:
         raise click.UsageError("--json and --follow are mutually exclusive.")
@@ -363,8 +362,7 @@ def logs(ctx: click.Context, lines: int, follow: bool, errors: bool, use_json: b
                 else:
                     time.sleep(0.2)
     else:
-        all_lines = LOG_PATH.read_text().splitlines()
-        tail = list(deque(all_lines, maxlen=lines))
+        tail = _tail(LOG_PATH, lines)
         if errors:
             tail = [line for line in tail if " ERROR " in line]
         if use_json:
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
-import plistlib
 import re
 import shlex
 import shutil
@@ -49,24 +49,65 @@ _TAG_MAP: dict[str, str] = {
 }
 
 
+# Longest-prefix-first match order, computed once instead of per log record.
+_TAG_PREFIXES = sorted(_TAG_MAP, key=len, reverse=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _tag_for_logger(name: str) -> str:
+    """Map a logger name to its daemon log tag. Cached — the set of logger
+    names in one process is tiny, so after warmup this is a dict hit."""
+    for prefix in _TAG_PREFIXES:
+        if name == prefix or name.startswith(prefix + "."):
+            return _TAG_MAP[prefix]
+    return "LOG"
+
+
 class DaemonFormatter(logging.Formatter):
     """Symmetric daemon log format: ``2026-04-03 00:52:08 UTC TAG   message``."""
 
     def format(self, record: logging.LogRecord) -> str:
         tag = getattr(record, "tag", None)
         if not tag:
-            name = record.name
-            for prefix in sorted(_TAG_MAP, key=len, reverse=True):
-                if name == prefix or name.startswith(prefix + "."):
-                    tag = _TAG_MAP[prefix]
-                    break
-            else:
-                tag = "LOG"
+            tag = _tag_for_logger(record.name)
         ts = datetime.fromtimestamp(record.created, UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
         return f"{ts} {tag:<5} {record.getMessage()}"
 
 
 LAUNCHD_LABEL = "com.syke.daemon"
+
+# Compiled once at import; generate_plist reduces to a single format_map pass.
+# Auth is never baked in: provider resolution happens at runtime from the
+# active Syke auth/config state and environment variables.
+_PLIST_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>{label}</string>
+    <key>ProgramArguments</key>
+    <array>
+        <string>{launcher_path}</string>
+        <string>--user</string>
+        <string>{user_id}</string>
+        <string>daemon</string>
+        <string>run</string>
+        <string>--interval</string>
+        <string>{interval}</string>
+    </array>
+    <key>KeepAlive</key>
+    <true/>
+    <key>RunAtLoad</key>
+    <true/>
+    <key>ThrottleInterval</key>
+    <integer>30</integer>
+    <key>StandardOutPath</key>
+    <string>{log_path}</string>
+    <key>StandardErrorPath</key>
+    <string>{log_path}</string>
+</dict>
+</plist>
+"""
 PLIST_PATH = Path(os.path.expanduser("~/Library/LaunchAgents")) / f"{LAUNCHD_LABEL}.plist"
 LOG_PATH = Path(os.path.expanduser("~/.config/syke/daemon.log"))
 SYSTEMD_SERVICE_NAME = "syke-daemon.service"
@@ -126,6 +167,13 @@ class SykeDaemon:
             self._start_ipc_server()
             self._start_web_server()
 
+            # SIGTERM/SIGINT may land mid-cycle; that is safe because the
+            # handler only sets stop flags (it never raises into the cycle),
+            # and both the loop condition and the inter-cycle wait observe
+            # them, so a signalled cycle finishes and shutdown follows
+            # immediately. Masking signals here would not help: the IPC/web
+            # threads accept process-directed signals too, and CPython runs
+            # the handler in this thread regardless.
             while self.running and not self._stop_event.is_set():
                 self._ensure_process_markers()
                 cycle_failed = False
@@ -383,7 +431,7 @@ class SykeDaemon:
     def _ensure_process_markers(self) -> None:
         expected_pid = str(os.getpid())
         try:
-            current_pid = PIDFILE.read_text().strip() if PIDFILE.exists() else None
+            current_pid = PIDFILE.read_text().strip()
         except OSError:
             current_pid = None
         if current_pid != expected_pid:
@@ -566,6 +614,35 @@ class SykeDaemon:
         self.stop()
 
 
+def _tail(path: Path, n: int) -> list[str]:
+    """Last ``n`` lines of ``path`` without reading the whole file.
+
+    Reads backwards from EOF in 8 KiB blocks until enough newlines are seen,
+    so cost is O(n · line length) regardless of how large the log has grown.
+    Returns [] when the file is missing.
+    """
+    if n <= 0:
+        return []
+    try:
+        fd = os.open(os.fspath(path), os.O_RDONLY)
+    except FileNotFoundError:
+        return []
+    try:
+        offset = os.fstat(fd).st_size
+        chunks: list[bytes] = []
+        newlines = 0
+        while offset > 0 and newlines <= n:
+            read_at = max(0, offset - 8192)
+            chunk = os.pread(fd, offset - read_at, read_at)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+            offset = read_at
+    finally:
+        os.close(fd)
+    lines = b"".join(reversed(chunks)).splitlines()
+    return [line.decode("utf-8", errors="replace") for line in lines[-n:]]
+
+
 # --- PID file helpers ---
 
 
@@ -714,17 +791,45 @@ def _pid_is_safe_daemon_target(pid: int) -> bool:
     return False
 
 
+def _probe_pid(pid: int) -> None:
+    """Probe liveness of ``pid``; raises like ``os.kill(pid, 0)``.
+
+    On Linux, prefers pidfd_open(2), which probes without touching signal
+    delivery at all. Note PermissionError from pidfd_open can only mean the
+    syscall itself was denied (e.g. a seccomp filter) — unlike kill(2) it
+    never means "exists but not signalable" — so everything except
+    ProcessLookupError falls through to the classic kill-0 probe, keeping
+    the kill-style error contract callers rely on.
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            os.close(os.pidfd_open(pid, 0))
+            return
+        except ProcessLookupError:
+            raise
+        except OSError:
+            pass
+    os.kill(pid, 0)
+
+
 def is_running() -> tuple[bool, int | None]:
     """Check if daemon is running. Returns (running, pid)."""
-    if not PIDFILE.exists():
+    # Single open instead of exists() + read: one stat-family syscall on the
+    # hot status path, and no absent-vs-unreadable race between the two.
+    try:
+        raw = PIDFILE.read_text()
+    except FileNotFoundError:
+        return False, None
+    except OSError:
+        _unlink_pidfile()
         return False, None
     try:
-        pid = int(PIDFILE.read_text().strip())
-    except (ValueError, OSError):
+        pid = int(raw.strip())
+    except ValueError:
         _unlink_pidfile()
         return False, None
     try:
-        os.kill(pid, 0)
+        _probe_pid(pid)
         if pid == os.getpid():
             return True, pid
         pid_looks_like_syke = _pid_looks_like_syke(pid)
@@ -784,48 +889,39 @@ def generate_plist(
     if source_install is None:
         source_install = _is_source_install()
 
-    log_path = str(LOG_PATH)
     runtime = resolve_background_syke_runtime()
     launcher_path = ensure_syke_launcher(runtime)
-    program_args = (
-        f"        <string>{launcher_path}</string>\n"
-        f"        <string>--user</string>\n"
-        f"        <string>{user_id}</string>\n"
-        f"        <string>daemon</string>\n"
-        f"        <string>run</string>\n"
-        f"        <string>--interval</string>\n"
-        f"        <string>{interval}</string>"
+    return _render_plist(str(launcher_path), user_id, interval, str(LOG_PATH))
+
+
+@functools.lru_cache(maxsize=32)
+def _render_plist(launcher_path: str, user_id: str, interval: int, log_path: str) -> str:
+    """Pure plist XML rendering, split from launcher resolution so repeated
+    installs with the same inputs skip the template interpolation."""
+    return _PLIST_TEMPLATE.format_map(
+        {
+            "label": LAUNCHD_LABEL,
+            "launcher_path": launcher_path,
+            "user_id": user_id,
+            "interval": interval,
+            "log_path": log_path,
+        }
     )
-    working_dir_block = ""
 
-    # Auth is not baked into the plist. Keys or endpoints captured at setup time
-    # become stale; runtime provider resolution should always use the current
-    # Syke auth store, config, and environment variables instead.
-    env_block = ""
 
-    return f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>{LAUNCHD_LABEL}</string>
-    <key>ProgramArguments</key>
-    <array>
-{program_args}
-    </array>
-{working_dir_block}{env_block}    <key>KeepAlive</key>
-    <true/>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>ThrottleInterval</key>
-    <integer>30</integer>
-    <key>StandardOutPath</key>
-    <string>{log_path}</string>
-    <key>StandardErrorPath</key>
-    <string>{log_path}</string>
-</dict>
-</plist>
-"""
+def _write_private_file(path: Path, content: str) -> None:
+    """Create/replace ``path`` with 0o600 permissions from the first syscall.
+
+    write_text-then-chmod leaves a window where a fresh file carries the
+    umask-default (often world-readable) mode; creating with an explicit mode
+    and fchmod-ing the open fd closes that race for pre-existing files too.
+    """
+    fd = os.open(os.fspath(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.fchmod(fd, 0o600)
+        os.write(fd, content.encode("utf-8"))
+    finally:
+        os.close(fd)
 
 
 def install_launchd(user_id: str, interval: int = DAEMON_INTERVAL) -> Path:
@@ -833,8 +929,7 @@ def install_launchd(user_id: str, interval: int = DAEMON_INTERVAL) -> Path:
     plist_content = generate_plist(user_id, interval=interval)
     PLIST_PATH.parent.mkdir(parents=True, exist_ok=True)
     LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    PLIST_PATH.write_text(plist_content)
-    os.chmod(PLIST_PATH, 0o600)
+    _write_private_file(PLIST_PATH, plist_content)
     LOG_PATH.touch(exist_ok=True)
     os.chmod(LOG_PATH, 0o600)
 
@@ -930,6 +1025,8 @@ def _parse_launchd_program(status: str) -> Path | None:
 
 
 def _program_from_plist(plist_path: Path) -> Path | None:
+    import plistlib
+
     try:
         with plist_path.open("rb") as handle:
             payload = plistlib.load(handle)
@@ -1125,18 +1222,36 @@ def _systemctl_user(args: list[str], *, timeout: float = 10.0, check: bool = Fal
     )
 
 
+# systemd availability rarely changes while Syke runs; cache the probe so
+# status polls don't fork systemctl every time.
+_SYSTEMD_PROBE_TTL = 60.0
+_systemd_probe_cache: tuple[float, tuple[bool, str]] | None = None
+
+
 def systemd_user_available() -> tuple[bool, str]:
     """Return whether the current shell can talk to the user systemd manager."""
+    global _systemd_probe_cache
+    now = time.monotonic()
+    if _systemd_probe_cache is not None and now - _systemd_probe_cache[0] < _SYSTEMD_PROBE_TTL:
+        return _systemd_probe_cache[1]
+
     if shutil.which("systemctl") is None:
-        return False, "systemctl not found"
-    try:
-        result = _systemctl_user(["show-environment"], timeout=5)
-    except (FileNotFoundError, OSError, subprocess.TimeoutExpired) as exc:
-        return False, str(exc)
-    if result.returncode == 0:
-        return True, "systemd user manager available"
-    detail = (result.stderr or result.stdout or "systemctl --user is unavailable").strip()
-    return False, detail
+        probe: tuple[bool, str] = (False, "systemctl not found")
+    else:
+        try:
+            result = _systemctl_user(["show-environment"], timeout=5)
+        except (FileNotFoundError, OSError, subprocess.TimeoutExpired) as exc:
+            probe = (False, str(exc))
+        else:
+            if result.returncode == 0:
+                probe = (True, "systemd user manager available")
+            else:
+                detail = (
+                    result.stderr or result.stdout or "systemctl --user is unavailable"
+                ).strip()
+                probe = (False, detail)
+    _systemd_probe_cache = (now, probe)
+    return probe
 
 
 def generate_systemd_unit(user_id: str, interval: int = DAEMON_INTERVAL) -> str:
@@ -1334,6 +1449,15 @@ def systemd_metadata() -> dict[str, object]:
 
 CRON_TAG = "# syke-daemon"
 
+# Whole-line match for tagged entries: one C-level pass over the crontab
+# instead of a Python splitlines + per-line substring scan.
+_CRON_TAG_LINE_RE = re.compile(rf"^.*{re.escape(CRON_TAG)}.*\n?", re.MULTILINE)
+
+
+def _strip_syke_cron_lines(crontab_text: str) -> tuple[str, int]:
+    """Remove syke-tagged lines. Returns (remaining text, lines removed)."""
+    return _CRON_TAG_LINE_RE.subn("", crontab_text)
+
 
 def _build_cron_entry(user_id: str, interval: int = DAEMON_INTERVAL) -> str:
     """Build a crontab line for periodic sync."""
@@ -1355,62 +1479,74 @@ def _build_cron_entry(user_id: str, interval: int = DAEMON_INTERVAL) -> str:
     )
 
 
-def install_cron(user_id: str, interval: int = DAEMON_INTERVAL) -> None:
-    """Append a tagged crontab entry for periodic sync."""
+def _read_crontab() -> str | None:
+    """Current user crontab text, or None when absent/unavailable.
+
+    The subprocess boundary for cron lives here (and in _write_crontab) so
+    tests can swap in an in-memory spool instead of mocking subprocess.run.
+    """
     import subprocess
 
+    try:
+        r = subprocess.run(["crontab", "-l"], capture_output=True, text=True, timeout=5)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if r.returncode != 0:
+        return None
+    return r.stdout
+
+
+def _write_crontab(text: str) -> None:
+    """Replace the user crontab with ``text``."""
+    import subprocess
+
+    subprocess.run(["crontab", "-"], input=text, text=True, check=True)
+
+
+def install_cron(user_id: str, interval: int = DAEMON_INTERVAL) -> None:
+    """Append a tagged crontab entry for periodic sync."""
     LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    # Read existing crontab
-    r = subprocess.run(["crontab", "-l"], capture_output=True, text=True)
-    if r.returncode == 0:
-        existing = r.stdout
-    else:
-        existing = ""
+    existing = _read_crontab() or ""
 
     # Remove any old syke-daemon entry
-    lines = [line for line in existing.splitlines() if CRON_TAG not in line]
-    lines.append(_build_cron_entry(user_id, interval))
+    remaining, _ = _strip_syke_cron_lines(existing)
+    if remaining and not remaining.endswith("\n"):
+        remaining += "\n"
 
-    new_crontab = "\n".join(lines) + "\n"
-    subprocess.run(["crontab", "-"], input=new_crontab, text=True, check=True)
+    _write_crontab(remaining + _build_cron_entry(user_id, interval) + "\n")
 
 
 def uninstall_cron() -> bool:
     """Remove syke-daemon entry from crontab. Returns True if removed."""
-    import subprocess
-
-    r = subprocess.run(["crontab", "-l"], capture_output=True, text=True)
-    if r.returncode != 0:
+    existing = _read_crontab()
+    if existing is None:
         return False
 
-    lines = r.stdout.splitlines()
-    filtered = [line for line in lines if CRON_TAG not in line]
-
-    if len(filtered) == len(lines):
+    filtered, removed = _strip_syke_cron_lines(existing)
+    if not removed:
         return False  # nothing to remove
 
-    new_crontab = "\n".join(filtered) + "\n"
-    subprocess.run(["crontab", "-"], input=new_crontab, text=True, check=True)
+    if filtered and not filtered.endswith("\n"):
+        filtered += "\n"
+    _write_crontab(filtered)
     return True
 
 
 def cron_is_running() -> tuple[bool, None]:
     """Check if a syke-daemon cron entry exists. Returns (found, None)."""
-    import subprocess
+    existing = _read_crontab()
+    return (existing is not None and CRON_TAG in existing), None
 
-    try:
-        r = subprocess.run(["crontab", "-l"], capture_output=True, text=True, timeout=5)
-        if r.returncode == 0 and CRON_TAG in r.stdout:
-            return True, None
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-    return False, None
 
+def cron_status(found: bool | None = None) -> str:
+    """Get human-readable cron daemon status.
 
-def cron_status() -> str:
-    """Get human-readable cron daemon status."""
-    found, _ = cron_is_running()
+    Callers that already ran ``cron_is_running()`` pass ``found`` so the
+    crontab is not forked a second time.
+    """
+    if found is None:
+        found, _ = cron_is_running()
     if found:
         return "[green]Cron job installed[/green] (syke-daemon)"
     return "[dim]No cron job installed[/dim]"
@@ -1419,14 +1555,20 @@ def cron_status() -> str:
 # --- CLI-friendly wrappers (platform-dispatched) ---
 
 
+# Platform → background-service backend, one dict lookup per dispatch.
+# Anything non-darwin uses the systemd user service; non-darwin uninstall
+# also clears legacy cron registrations from older Syke versions.
+_PLATFORM_INSTALLERS = {"darwin": install_launchd}
+_PLATFORM_UNINSTALLERS = {"darwin": (uninstall_launchd,)}
+_DEFAULT_UNINSTALLERS = (uninstall_systemd_user, uninstall_cron)
+
+
 def install_and_start(user_id: str, interval: int = DAEMON_INTERVAL) -> None:
     """Install and start the background service for the current platform."""
     import sys
 
-    if sys.platform == "darwin":
-        install_launchd(user_id, interval=interval)
-    else:
-        install_systemd_user(user_id, interval=interval)
+    installer = _PLATFORM_INSTALLERS.get(sys.platform, install_systemd_user)
+    installer(user_id, interval=interval)
 
 
 def stop_and_unload() -> None:
@@ -1434,12 +1576,8 @@ def stop_and_unload() -> None:
     import sys
 
     running, pid = is_running()
-    if sys.platform == "darwin":
-        uninstall_launchd()
-    else:
-        uninstall_systemd_user()
-        # Remove legacy cron registration from older Syke versions.
-        uninstall_cron()
+    for uninstall in _PLATFORM_UNINSTALLERS.get(sys.platform, _DEFAULT_UNINSTALLERS):
+        uninstall()
 
     if running and pid is not None:
         if _pid_is_safe_daemon_target(pid):
@@ -1509,6 +1647,6 @@ def get_status() -> str:
                 f"\n\nsystemd state: {active}/{sub}"
             )
         elif cron_found:
-            return cron_status()
+            return cron_status(found=cron_found)
         else:
             return "[dim]Daemon not running[/dim]"
@@ -13,6 +13,7 @@ Threat floor: personal-machine.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
@@ -103,8 +104,14 @@ def _full_text(text: str | None) -> str:
     return text or ""
 
 
+@functools.lru_cache(maxsize=64)
 def _memex_body_hash(text: str | None) -> str | None:
-    """Stable hash for movement: compare MEMEX content, not reconstruction row IDs."""
+    """Stable hash for movement: compare MEMEX content, not reconstruction row IDs.
+
+    Memoized: the timeline loop hashes the memex snapshot behind every cycle
+    row, and across adjacent cycles the content is usually identical — a cache
+    hit skips the header-strip pass and the SHA-256 entirely.
+    """
     if text is None:
         return None
     body = _to_text(text).replace("\r\n", "\n").strip()
@@ -127,6 +134,39 @@ def _memex_body_hash(text: str | None) -> str | None:
     return hashlib.sha256(body.encode("utf-8")).hexdigest()
 
 
+# Compiled once: _trace_writes_memex runs per trace row on every dashboard
+# poll, and re.compile per call was the dominant cost of the check.
+_DB_WRITE_RE = re.compile(
+    r"\b(update|insert|replace)\b[\s\S]{0,900}\bmemories\b|"
+    r"\bmemories\b[\s\S]{0,900}\b(update|insert|replace)\b",
+    re.IGNORECASE,
+)
+_FILE_WRITE_RE = re.compile(
+    r"("
+    r"write_text\s*\(|"
+    r"open\s*\([^)]*MEMEX\.md[^)]*,\s*['\"][^'\"]*w|"
+    r">\s*[^;\n]*MEMEX\.md|"
+    r"tee(?:\s+-a)?\s+[^;\n]*MEMEX\.md|"
+    r"cp\s+[^;\n]*\s+MEMEX\.md|"
+    r"mv\s+[^;\n]*\s+MEMEX\.md|"
+    r"tmp\.rename\s*\(\s*MEMEX_PATH|"
+    r"tmp\.rename\s*\([^)]*MEMEX\.md|"
+    r"MEMEX_PATH\.(?:write_text|open|rename|replace)"
+    r")",
+    re.IGNORECASE,
+)
+_MEMEX_MARKER_RE = re.compile(
+    r"__memex__|source_event_ids|memex_fullchain|memex-recovered|"
+    r"recovered_memex|recovered-memex",
+    re.IGNORECASE,
+)
+_UUID_RE = re.compile(
+    r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b",
+    re.IGNORECASE,
+)
+_MEMORIES_WORD_RE = re.compile(r"\bmemories\b", re.IGNORECASE)
+
+
 def _trace_writes_memex(
     tool_calls_text: str | None,
     *,
@@ -137,34 +177,6 @@ def _trace_writes_memex(
     if not isinstance(calls, list):
         return False
 
-    db_write_re = re.compile(
-        r"\b(update|insert|replace)\b[\s\S]{0,900}\bmemories\b|"
-        r"\bmemories\b[\s\S]{0,900}\b(update|insert|replace)\b",
-        re.IGNORECASE,
-    )
-    file_write_re = re.compile(
-        r"("
-        r"write_text\s*\(|"
-        r"open\s*\([^)]*MEMEX\.md[^)]*,\s*['\"][^'\"]*w|"
-        r">\s*[^;\n]*MEMEX\.md|"
-        r"tee(?:\s+-a)?\s+[^;\n]*MEMEX\.md|"
-        r"cp\s+[^;\n]*\s+MEMEX\.md|"
-        r"mv\s+[^;\n]*\s+MEMEX\.md|"
-        r"tmp\.rename\s*\(\s*MEMEX_PATH|"
-        r"tmp\.rename\s*\([^)]*MEMEX\.md|"
-        r"MEMEX_PATH\.(?:write_text|open|rename|replace)"
-        r")",
-        re.IGNORECASE,
-    )
-    memex_marker_re = re.compile(
-        r"__memex__|source_event_ids|memex_fullchain|memex-recovered|"
-        r"recovered_memex|recovered-memex",
-        re.IGNORECASE,
-    )
-    uuid_re = re.compile(
-        r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b",
-        re.IGNORECASE,
-    )
     known_memex_ids = memex_ids or set()
 
     for call in calls:
@@ -183,12 +195,12 @@ def _trace_writes_memex(
         elif raw_input is not None:
             parts = [str(raw_input)]
         text = "\n".join(parts)
-        if ("MEMEX.md" in text or "MEMEX_PATH" in text) and file_write_re.search(text):
+        if ("MEMEX.md" in text or "MEMEX_PATH" in text) and _FILE_WRITE_RE.search(text):
             return True
-        if re.search(r"\bmemories\b", text, re.IGNORECASE) and db_write_re.search(text):
-            if memex_marker_re.search(text):
+        if _MEMORIES_WORD_RE.search(text) and _DB_WRITE_RE.search(text):
+            if _MEMEX_MARKER_RE.search(text):
                 return True
-            if known_memex_ids and known_memex_ids.intersection(uuid_re.findall(text)):
+            if known_memex_ids and known_memex_ids.intersection(_UUID_RE.findall(text)):
                 return True
     return False
 
@@ -200,7 +212,10 @@ def _iso_second(text: str | None) -> str:
     return text[:19]
 
 
+@functools.lru_cache(maxsize=1024)
 def _iso_to_dt(s: str | None) -> datetime | None:
+    # Memoized: the dashboard endpoints re-parse the same created_at /
+    # completed_at strings on every poll, and datetime is immutable.
     if not s:
         return None
     # Query strings can come through as `2026-05-12T22:00:00 00:00` when
@@ -210,7 +225,8 @@ def _iso_to_dt(s: str | None) -> datetime | None:
     if " " in s:
         s = re.sub(r"\s(\d{2}:\d{2})$", r"+\1", s)
     try:
-        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+        # fromisoformat accepts the Z suffix natively on 3.11+
+        return datetime.fromisoformat(s)
     except ValueError:
         return None
 
@@ -832,13 +848,11 @@ def query_log_tail(lines: int) -> dict[str, Any]:
     if not DAEMON_LOG_PATH.exists():
         return {"path": str(DAEMON_LOG_PATH), "lines": [], "exists": False}
     try:
-        with DAEMON_LOG_PATH.open("rb") as fh:
-            buf: deque[bytes] = deque(maxlen=n)
-            for raw in fh:
-                buf.append(raw.rstrip(b"\n"))
+        from syke.daemon.daemon import _tail
+
         return {
             "path": str(DAEMON_LOG_PATH),
-            "lines": [b.decode("utf-8", errors="replace") for b in buf],
+            "lines": _tail(DAEMON_LOG_PATH, n),
             "exists": True,
         }
     except OSError as exc:
@@ -1011,7 +1025,9 @@ def make_handler(user_id: str, html_path: Path) -> type[BaseHTTPRequestHandler]:
             return
 
         def _send_json(self, status: int, payload: Any) -> None:
-            body = json.dumps(payload, default=str).encode("utf-8")
+            # Compact separators: timeline payloads carry full transcripts, and
+            # the default ", "/": " delimiters add dead bytes per element.
+            body = json.dumps(payload, default=str, separators=(",", ":")).encode("utf-8")
             self.send_response(status)
             self.send_header("Content-Type", "application/json; charset=utf-8")
             self.send_header("Content-Length", str(len(body)))
@@ -252,6 +252,9 @@ class SykeDB:
         conn = sqlite3.connect(db_path)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA journal_mode=WAL")
+        # WAL-safe durability: fsync at checkpoints instead of every commit.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
         conn.execute("PRAGMA busy_timeout = 5000")
         conn.execute("PRAGMA foreign_keys=ON")
         return conn
@@ -473,6 +476,36 @@ class SykeDB:
             self._conn.commit()
         return memory.id
 
+    def insert_memories(self, memories: list[Memory]) -> list[str]:
+        """Insert a batch of memories with one executemany and one commit.
+
+        Amortizes the per-row statement and commit cost over the batch;
+        FTS5 sync happens through the same triggers as insert_memory.
+        """
+        now = datetime.now(UTC).isoformat()
+        rows = [
+            (
+                memory.id,
+                memory.user_id,
+                memory.content,
+                json.dumps(memory.source_event_ids),
+                memory.created_at.isoformat() if isinstance(memory.created_at, datetime) else now,
+                None,
+                memory.superseded_by,
+                1 if memory.active else 0,
+            )
+            for memory in memories
+        ]
+        self._conn.executemany(
+            """INSERT INTO memories
+               (id, user_id, content, source_event_ids, created_at, updated_at, superseded_by, active)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            rows,
+        )
+        if not self._in_transaction:
+            self._conn.commit()
+        return [memory.id for memory in memories]
+
     def count_memories(self, user_id: str, active_only: bool = True) -> int:
         """Count memories for a user."""
         if active_only:
@@ -499,6 +532,26 @@ class SykeDB:
         ).fetchone()
         return dict(row) if row else None
 
+    def get_all_memex(self) -> dict[str, str]:
+        """Most recent active memex content for every user in one query.
+
+        Multi-user fan-out (distribution) should use this instead of calling
+        get_memex() per user — one round-trip instead of N.
+        """
+        rows = self._conn.execute(
+            """SELECT user_id, content FROM (
+                   SELECT user_id, content,
+                          ROW_NUMBER() OVER (
+                              PARTITION BY user_id
+                              ORDER BY datetime(created_at) DESC, id DESC
+                          ) AS rn
+                   FROM memories
+                   WHERE active = 1 AND source_event_ids = ?
+               ) WHERE rn = 1""",
+            (json.dumps(["__memex__"]),),
+        ).fetchall()
+        return {row["user_id"]: row["content"] for row in rows}
+
     # ===================================================================
     # Cycle Records
     # ===================================================================
@@ -160,29 +160,43 @@ def capture_baseline(db: Any, user_id: str) -> StateBaseline:
     )
 
 
+def _fingerprint_json(value: MemoryFingerprint) -> Any:
+    data = asdict(value)
+    data["content"] = f"<redacted:{len(value.content)} chars>"
+    return _json_ready(data)
+
+
+def _baseline_json(value: StateBaseline) -> Any:
+    return {
+        "user_id": value.user_id,
+        "captured_at": value.captured_at,
+        "active_non_memex_count": value.active_non_memex_count,
+        "memories_total": value.memories_total,
+        "links_total": value.links_total,
+        "active_memories": _json_ready(value.active_memories),
+        "memex_memories": _json_ready(value.memex_memories),
+        "memex_id": value.memex_id,
+        "memex_hash": value.memex_hash,
+        "memex_count": value.memex_count,
+        "table_counts": _json_ready(value.table_counts),
+    }
+
+
+# Type-keyed dispatch instead of an isinstance chain: _json_ready runs once
+# per fingerprint field when a baseline is serialized, and a single dict
+# lookup on type(value) beats walking four isinstance checks per value.
+_JSON_READY_HANDLERS: dict[type, Any] = {
+    MemoryFingerprint: _fingerprint_json,
+    StateBaseline: _baseline_json,
+    dict: lambda value: {key: _json_ready(item) for key, item in value.items()},
+    list: lambda value: [_json_ready(item) for item in value],
+}
+
+
 def _json_ready(value: Any) -> Any:
-    if isinstance(value, MemoryFingerprint):
-        data = asdict(value)
-        data["content"] = f"<redacted:{len(value.content)} chars>"
-        return _json_ready(data)
-    if isinstance(value, StateBaseline):
-        return {
-            "user_id": value.user_id,
-            "captured_at": value.captured_at,
-            "active_non_memex_count": value.active_non_memex_count,
-            "memories_total": value.memories_total,
-            "links_total": value.links_total,
-            "active_memories": _json_ready(value.active_memories),
-            "memex_memories": _json_ready(value.memex_memories),
-            "memex_id": value.memex_id,
-            "memex_hash": value.memex_hash,
-            "memex_count": value.memex_count,
-            "table_counts": _json_ready(value.table_counts),
-        }
-    if isinstance(value, dict):
-        return {key: _json_ready(item) for key, item in value.items()}
-    if isinstance(value, list):
-        return [_json_ready(item) for item in value]
+    handler = _JSON_READY_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value)
     if hasattr(value, "__dataclass_fields__"):
         return _json_ready(asdict(value))
     return value
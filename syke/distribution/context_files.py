@@ -7,6 +7,7 @@ runtime: exported memex files and Syke capability registration.
 from __future__ import annotations
 
 import logging
+import os
 from importlib.resources import files
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -21,6 +22,10 @@ CURSOR_COMMANDS_DIR = Path.home() / ".cursor" / "commands"
 COPILOT_AGENTS_DIR = Path.home() / ".copilot" / "agents"
 ANTIGRAVITY_WORKFLOWS_DIR = Path.home() / ".gemini" / "antigravity" / "global_workflows"
 
+# Fallback prefixes emitted by get_memex_for_injection when there is no real
+# memex yet. One tuple startswith scan instead of a chain of substring checks.
+_PLACEHOLDER_PREFIXES = ("[First run", "[No ")
+
 
 def distribute_memex(db: SykeDB, user_id: str) -> Path | None:
     """Verify memex exists but do NOT overwrite the workspace file.
@@ -36,7 +41,7 @@ def distribute_memex(db: SykeDB, user_id: str) -> Path | None:
     from syke.runtime.workspace import MEMEX_PATH
 
     content = get_memex_for_injection(db, user_id)
-    if not content or content.startswith("[First run") or content.startswith("[No "):
+    if not content or content.startswith(_PLACEHOLDER_PREFIXES):
         return None
 
     # The workspace file is written by synthesis (_write_memex_artifact).
@@ -44,6 +49,25 @@ def distribute_memex(db: SykeDB, user_id: str) -> Path | None:
     return MEMEX_PATH if MEMEX_PATH.exists() else None
 
 
+def distribute_all_memex(db: SykeDB) -> dict[str, Path | None]:
+    """Multi-user distribute_memex in one DB round-trip.
+
+    Per-user distribute_memex calls cost one SELECT each; fan-out across all
+    users reads every latest memex with a single query instead.
+    Returns {user_id: memex path or None}, same semantics as distribute_memex.
+    """
+    from syke.runtime.workspace import MEMEX_PATH
+
+    memex_path = MEMEX_PATH if MEMEX_PATH.exists() else None
+    results: dict[str, Path | None] = {}
+    for user_id, content in db.get_all_memex().items():
+        if not content or content.startswith(_PLACEHOLDER_PREFIXES):
+            results[user_id] = None
+        else:
+            results[user_id] = memex_path
+    return results
+
+
 # --- Capability registration ---
 
 
@@ -69,10 +93,20 @@ def _render_skill_content(user_id: str) -> str:
 
 
 def _write_text_file(target: Path, content: str) -> Path:
-    target.parent.mkdir(parents=True, exist_ok=True)
-    tmp = target.with_suffix(".tmp")
-    tmp.write_text(content, encoding="utf-8")
-    tmp.rename(target)
+    # Hot loop in install_skill: work on plain path strings internally and
+    # keep Path objects at the public boundary only.
+    target_str = os.fspath(target)
+    os.makedirs(os.path.dirname(target_str), exist_ok=True)
+    tmp = target_str + ".tmp"
+    # Encode once and issue one physical write, instead of text-mode's
+    # chunked encode-and-write through the default 8KB buffer.
+    blob = content.encode("utf-8")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, blob)
+    finally:
+        os.close(fd)
+    os.replace(tmp, target_str)
     return target
 
 
@@ -18,7 +18,8 @@ def _hours_ago(iso_timestamp: str | None) -> float | None:
     if not iso_timestamp:
         return None
     try:
-        then = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
+        # fromisoformat accepts the Z suffix natively on 3.11+
+        then = datetime.fromisoformat(iso_timestamp)
         if then.tzinfo is None:
             then = then.replace(tzinfo=UTC)
         now = datetime.now(UTC)
@@ -82,7 +83,7 @@ def _parse_iso_timestamp(raw: object) -> datetime | None:
     if not isinstance(raw, str) or not raw:
         return None
     try:
-        parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        parsed = datetime.fromisoformat(raw)
     except ValueError:
         return None
     if parsed.tzinfo is None:
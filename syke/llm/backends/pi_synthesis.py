@@ -391,7 +391,7 @@ def _sync_memex_to_db(
                 "Memex artifact synced into canonical DB (%d chars)", len(canonical_content)
             )
         except Exception as e:
-            logger.error(f"Failed to sync memex artifact into DB: {e}")
+            logger.error("Failed to sync memex artifact into DB: %s", e)
             return result
         current_content = _current_memex_content(db, user_id)
         if current_content is None:
@@ -411,7 +411,7 @@ def _sync_memex_to_db(
                 len(canonical_content),
             )
         except Exception as e:
-            logger.error(f"Failed to restore previous canonical memex: {e}")
+            logger.error("Failed to restore previous canonical memex: %s", e)
             return result
         current_content = _current_memex_content(db, user_id)
         if current_content is None:
@@ -425,7 +425,7 @@ def _sync_memex_to_db(
             update_memex(db, user_id, canonical_content)
             logger.info("Recorded empty first-run MEMEX state (%d chars)", len(canonical_content))
         except Exception as e:
-            logger.error(f"Failed to record empty first-run MEMEX state: {e}")
+            logger.error("Failed to record empty first-run MEMEX state: %s", e)
             return result
         current_content = _current_memex_content(db, user_id)
         if current_content is None:
@@ -461,7 +461,7 @@ def _sync_memex_to_db(
         )
         return result
     except Exception as e:
-        logger.error(f"Failed to project canonical memex artifact: {e}")
+        logger.error("Failed to project canonical memex artifact: %s", e)
         return result
 
 
@@ -1115,7 +1115,7 @@ def pi_synthesize(
                 started_at_override=_started_at_override,
             )
         except Exception as e:
-            logger.warning(f"Failed to record cycle start: {e}")
+            logger.warning("Failed to record cycle start: %s", e)
 
         try:
             safety_baseline = capture_baseline(db, user_id)
@@ -1323,7 +1323,7 @@ def pi_synthesize(
             )
 
         if not pi_result.ok:
-            logger.error(f"Pi synthesis failed: {pi_result.error}")
+            logger.error("Pi synthesis failed: %s", pi_result.error)
             return _fail_after_restore(
                 error=str(pi_result.error or "Pi synthesis failed"),
                 recovery_point=recovery_point,
@@ -1353,7 +1353,7 @@ def pi_synthesize(
         result["validation"] = validation
 
         if not validation["valid"]:
-            logger.warning(f"Cycle output validation issues: {validation['issues']}")
+            logger.warning("Cycle output validation issues: %s", validation["issues"])
             failed_validation = _fail_cycle_for_db_validation(
                 validation,
                 _db_validation_issues(validation),
@@ -1389,7 +1389,7 @@ def pi_synthesize(
             validation = _validate_cycle_output()
             result["validation"] = validation
             if not validation["valid"]:
-                logger.warning(f"Cycle output validation issues: {validation['issues']}")
+                logger.warning("Cycle output validation issues: %s", validation["issues"])
                 failed_validation = _fail_cycle_for_db_validation(
                     validation,
                     _db_validation_issues(validation),
@@ -1575,7 +1575,7 @@ def pi_synthesize(
             if refresh_validation_after_commit:
                 validation = _validate_cycle_output()
                 result["validation"] = validation
-            logger.info(f"Post-synthesis commit for cycle {cycle_id}")
+            logger.info("Post-synthesis commit for cycle %s", cycle_id)
         except _SynthesisCommitFailed as e:
             # Memex sync failed — transaction rolled back.
             logger.error("%s; transaction rolled back", e)
@@ -1662,7 +1662,7 @@ def pi_synthesize(
         )
         result["trace_id"] = trace_id
 
-        logger.info(f"Pi synthesis complete: {tool_call_count} tool calls, {total_duration}ms")
+        logger.info("Pi synthesis complete: %d tool calls, %dms", tool_call_count, total_duration)
 
         return result
 
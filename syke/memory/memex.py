@@ -54,11 +54,13 @@ def update_memex(db: SykeDB, user_id: str, new_content: str) -> str:
                 )
         return str(existing["id"])
 
-    new_memory = Memory(
+    # Internal trusted path: every field is produced here, so skip pydantic
+    # validation. User-provided memories (syke record) stay validated.
+    new_memory = Memory.model_construct(
         id=str(uuid7()),
         user_id=user_id,
         content=canonical_content,
-        source_event_ids=MEMEX_MARKER,
+        source_event_ids=list(MEMEX_MARKER),
     )
 
     with db.transaction():
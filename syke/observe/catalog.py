@@ -4,19 +4,19 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscoverRoot:
     path: str
     include: list[str] = field(default_factory=list)
     priority: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscoverConfig:
     roots: list[DiscoverRoot]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceSpec:
     source: str
     format_cluster: str
@@ -190,15 +190,17 @@ _CATALOG: tuple[SourceSpec, ...] = (
 )
 
 
+# Name → spec index built once at import; get_source is called per source
+# on every observe/status pass and the catalog is immutable.
+_SOURCES_BY_NAME: dict[str, SourceSpec] = {spec.source: spec for spec in _CATALOG}
+
+
 def active_sources() -> tuple[SourceSpec, ...]:
     return _CATALOG
 
 
 def get_source(source: str) -> SourceSpec | None:
-    for spec in _CATALOG:
-        if spec.source == source:
-            return spec
-    return None
+    return _SOURCES_BY_NAME.get(source)
 
 
 def _resolve_root_path(raw_path: str, *, home: Path | None = None) -> Path:
@@ -6,29 +6,47 @@ import re
 logger = logging.getLogger(__name__)
 
 
-# Patterns that indicate private messaging pasted into AI conversations
-_PRIVATE_MSG_PATTERNS = [
+# Patterns that indicate private messaging pasted into AI conversations,
+# merged into one alternation so each line is scanned once.
+_PRIVATE_MSG_RE = re.compile(
     # WhatsApp: [10/6/25, 5:08:37 AM] Name: message
-    re.compile(r"\[\d{1,2}/\d{1,2}/\d{2,4},\s+\d{1,2}:\d{2}:\d{2}\s*[AP]M\]\s+\w+"),
+    r"\[\d{1,2}/\d{1,2}/\d{2,4},\s+\d{1,2}:\d{2}:\d{2}\s*[AP]M\]\s+\w+"
     # iMessage/SMS timestamp dumps
-    re.compile(r"(?:iMessage|SMS)\s+\d{1,2}/\d{1,2}/\d{2,4}"),
+    r"|(?:iMessage|SMS)\s+\d{1,2}/\d{1,2}/\d{2,4}"
     # Telegram export format
-    re.compile(r"\d{2}\.\d{2}\.\d{4}\s+\d{2}:\d{2}\s+-\s+\w+"),
-]
-
-# Credential patterns to strip from content
-_CREDENTIAL_PATTERNS = [
-    re.compile(r"sk-ant-api\d+-[A-Za-z0-9_-]{20,}"),  # Anthropic keys
-    re.compile(r"sk-[A-Za-z0-9]{20,}"),  # OpenAI keys
-    re.compile(r"ghp_[A-Za-z0-9]{36,}"),  # GitHub tokens
-    re.compile(r"gho_[A-Za-z0-9]{36,}"),  # GitHub OAuth
-    re.compile(r"xoxb-[A-Za-z0-9-]+"),  # Slack tokens
-    re.compile(r"Bearer\s+[A-Za-z0-9._-]{20,}"),  # Bearer tokens
-    re.compile(r'password\s*[=:]\s*["\']?[^\s"\']{8,}', re.IGNORECASE),
-    re.compile(r"AKIA[0-9A-Z]{16}"),  # AWS access keys
-    re.compile(r"-----BEGIN\s[\w\s]*PRIVATE KEY-----"),  # SSH/PEM private keys
-    re.compile(r"\w+://\w+:[^@\s]{3,}@[\w.-]+"),  # DB connection strings with passwords
-]
+    r"|\d{2}\.\d{2}\.\d{4}\s+\d{2}:\d{2}\s+-\s+\w+"
+)
+
+# Credential patterns to strip from content. One alternation means sanitize
+# walks the string once instead of once per pattern; branch order keeps the
+# specific prefixes (sk-ant-…) ahead of the generic ones (sk-…).
+_CREDENTIAL_RE = re.compile(
+    r"sk-ant-api\d+-[A-Za-z0-9_-]{20,}"  # Anthropic keys
+    r"|sk-[A-Za-z0-9]{20,}"  # OpenAI keys
+    r"|ghp_[A-Za-z0-9]{36,}"  # GitHub tokens
+    r"|gho_[A-Za-z0-9]{36,}"  # GitHub OAuth
+    r"|xoxb-[A-Za-z0-9-]+"  # Slack tokens
+    r"|Bearer\s+[A-Za-z0-9._-]{20,}"  # Bearer tokens
+    r"|(?i:password\s*[=:]\s*[\"']?[^\s\"']{8,})"
+    r"|AKIA[0-9A-Z]{16}"  # AWS access keys
+    r"|-----BEGIN\s[\w\s]*PRIVATE KEY-----"  # SSH/PEM private keys
+    r"|\w+://\w+:[^@\s]{3,}@[\w.-]+"  # DB connection strings with passwords
+)
+
+# Lowercased literals that every credential pattern above contains. Most
+# content has none of them, and substring scans are far cheaper than the
+# alternation, so sanitize fast-rejects clean content without running it.
+_CREDENTIAL_TRIGGERS = (
+    "sk-",
+    "ghp_",
+    "gho_",
+    "xoxb-",
+    "bearer",
+    "password",
+    "akia",
+    "-----begin",
+    "://",
+)
 
 
 class ContentFilter:
@@ -60,9 +78,7 @@ class ContentFilter:
         # Two thresholds: high ratio of lines, OR absolute count of private messages
         lines = content.split("\n")
         if len(lines) > 5:
-            msg_lines = sum(
-                1 for line in lines if any(p.search(line) for p in _PRIVATE_MSG_PATTERNS)
-            )
+            msg_lines = sum(1 for line in lines if _PRIVATE_MSG_RE.search(line))
             ratio = msg_lines / len(lines)
             # Skip if >20% of lines are private messages
             if ratio > 0.2:
@@ -78,14 +94,12 @@ class ContentFilter:
 
     def sanitize(self, content: str) -> str:
         """Remove credentials and sensitive patterns from content."""
-        sanitized = content
-        changed = False
-        for pattern in _CREDENTIAL_PATTERNS:
-            new = pattern.sub("[REDACTED]", sanitized)
-            if new != sanitized:
-                changed = True
-                sanitized = new
-        if changed:
+        lowered = content.lower()
+        if not any(trigger in lowered for trigger in _CREDENTIAL_TRIGGERS):
+            self.stats["kept"] += 1
+            return content
+        sanitized, redactions = _CREDENTIAL_RE.subn("[REDACTED]", content)
+        if redactions:
             self.stats["sanitized"] += 1
         self.stats["kept"] += 1
         return sanitized
@@ -98,6 +112,6 @@ class ContentFilter:
         """
         skip, reason = self.should_skip(content, title)
         if skip:
-            logger.debug(f"Content filter SKIP: {reason} | title={title[:50]}")
+            logger.debug("Content filter SKIP: %s | title=%s", reason, title[:50])
             return None, reason
         return self.sanitize(content), "kept"
@@ -87,7 +87,9 @@ class HarnessRegistry:
                 details={"roots": [str(root) for root in discovered_roots(spec)]},
             )
 
-        latest = max(files, key=lambda path: (path.stat().st_mtime, str(path)))
+        # One stat per file: keying max() on (mtime, path) and re-statting the
+        # winner afterwards paid an extra syscall per health check.
+        latest_mtime = max(path.stat().st_mtime for path in files)
         has_adapter = (
             get_deployed_adapter_md_path(source, adapters_dir=self.dynamic_adapters_dir) is not None
             or get_seed_adapter_md_path(source) is not None
@@ -97,7 +99,7 @@ class HarnessRegistry:
             status="healthy" if has_adapter else "no_adapter",
             last_check=now,
             files_found=len(files),
-            latest_file_mtime=latest.stat().st_mtime,
+            latest_file_mtime=latest_mtime,
             error=None if has_adapter else "No deployed adapter",
             details={
                 "roots": [str(root) for root in discovered_roots(spec)],
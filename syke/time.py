@@ -5,9 +5,10 @@ Store UTC. Precompute local. The LLM is a narrator, not a clock.
 
 from __future__ import annotations
 
+import functools
 import os
 from contextlib import suppress
-from datetime import UTC, datetime, tzinfo
+from datetime import UTC, datetime, timedelta, tzinfo
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -74,7 +75,9 @@ def day_part(hour: int) -> str:
 def to_local(dt_or_iso: datetime | str, user_tz: tzinfo | None = None) -> datetime:
     """Convert UTC datetime or ISO string to user's local timezone."""
     if isinstance(dt_or_iso, str):
-        dt_or_iso = datetime.fromisoformat(dt_or_iso.replace("Z", "+00:00"))
+        # fromisoformat handles the Z suffix natively on 3.11+ (we require
+        # 3.12) — no need to pre-normalize with a string copy.
+        dt_or_iso = datetime.fromisoformat(dt_or_iso)
     tz = user_tz or resolve_user_tz()
     return require_utc(dt_or_iso).astimezone(tz)
 
@@ -93,31 +96,62 @@ def format_for_llm(dt_or_iso: datetime | str, user_tz: tzinfo | None = None) ->
     return f"{local_str} {tz_abbrev} ({utc_short}) · {part}"
 
 
-def format_for_human(dt_or_iso: datetime | str, user_tz: tzinfo | None = None) -> str:
-    """Format for CLI display: relative labels (today/yesterday) + time."""
+def today_midnight_local(user_tz: tzinfo | None = None) -> datetime:
+    """Local midnight for 'now' — the today/yesterday boundary for rendering."""
+    tz = user_tz or resolve_user_tz()
+    return datetime.now(tz).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def format_for_human(
+    dt_or_iso: datetime | str,
+    user_tz: tzinfo | None = None,
+    today_midnight: datetime | None = None,
+) -> str:
+    """Format for CLI display: relative labels (today/yesterday) + time.
+
+    Callers rendering a list of timestamps should compute ``today_midnight``
+    once via :func:`today_midnight_local` and pass it in, instead of paying a
+    clock read per rendered entry.
+    """
     local = to_local(dt_or_iso, user_tz)
-    now = datetime.now(UTC).astimezone(local.tzinfo)
+    if today_midnight is None:
+        today_midnight = today_midnight_local(local.tzinfo)
     time_str = local.strftime("%H:%M:%S")
-    if local.date() == now.date():
+    today = today_midnight.date()
+    if local.date() == today:
         return f"today {time_str}"
-    from datetime import timedelta
-
-    if local.date() == (now - timedelta(days=1)).date():
+    if local.date() == today - timedelta(days=1):
         return f"yesterday {time_str}"
     return local.strftime("%b %d %H:%M:%S")
 
 
 def temporal_grounding_block(user_tz: tzinfo | None = None) -> str:
-    """Generate the temporal grounding block for injection into prompts."""
+    """Generate the temporal grounding block for injection into prompts.
+
+    The block only displays minute precision, so repeated prompt assembly
+    within the same minute reuses a cached render keyed on (tz, minute)
+    instead of rebuilding the markdown each time.
+    """
     tz = user_tz or resolve_user_tz()
+    tz_key = getattr(tz, "key", None)
     now_utc = datetime.now(UTC)
+    if tz_key is None:
+        # Fixed-offset or anonymous tzinfo — not reconstructable from a key.
+        return _build_temporal_grounding_block(tz, str(tz), now_utc)
+    return _temporal_grounding_block_cached(tz_key, int(now_utc.timestamp() // 60))
+
+
+@functools.lru_cache(maxsize=16)
+def _temporal_grounding_block_cached(tz_key: str, minute_bucket: int) -> str:
+    now_utc = datetime.fromtimestamp(minute_bucket * 60, UTC)
+    return _build_temporal_grounding_block(ZoneInfo(tz_key), tz_key, now_utc)
+
+
+def _build_temporal_grounding_block(tz: tzinfo, tz_name: str, now_utc: datetime) -> str:
     now_local = now_utc.astimezone(tz)
 
-    tz_name = getattr(tz, "key", None) or str(tz)
     time_str = now_local.strftime("%a %b %d, %Y %I:%M %p %Z").replace(" 0", " ")
     today = now_local.strftime("%A")
-    from datetime import timedelta
-
     yesterday = (now_local - timedelta(days=1)).strftime("%A")
 
     return (
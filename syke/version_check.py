@@ -5,6 +5,7 @@ Pure stdlib — no new dependencies.
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 import time
@@ -18,8 +19,15 @@ CACHE_PATH = SYKE_HOME / "version_cache.json"
 CACHE_TTL_SECONDS = 86400  # 24 hours
 
 
+@functools.lru_cache(maxsize=64)
 def _version_gt(a: str, b: str) -> bool:
-    """Return True if version a is strictly greater than b (release segment only)."""
+    """Return True if version a is strictly greater than b (release segment only).
+
+    Memoized: the CLI re-compares the same (latest, installed) pair across
+    hook invocations in one process, so repeated lookups skip the parse.
+    """
+    if a == b:
+        return False
 
     def _parse(v: str) -> tuple[int, ...]:
         m = re.match(r"^(\d+(?:\.\d+)*)", v or "")
@@ -55,7 +63,9 @@ def _write_cache(version: str) -> None:
     """Write version to cache file with current timestamp."""
     try:
         SYKE_HOME.mkdir(parents=True, exist_ok=True)
-        CACHE_PATH.write_text(json.dumps({"version": version, "timestamp": time.time()}))
+        # Hand-rolled two-key object: skips building an intermediate dict and
+        # json's encoder machinery for this trivial payload.
+        CACHE_PATH.write_text(f'{{"version": {json.dumps(version)}, "timestamp": {time.time()}}}')
     except Exception:
         pass
 
@@ -1,4 +1,9 @@
-"""Shared test fixtures — keeps individual test files lean."""
+"""Shared test fixtures — keeps individual test files lean.
+
+State is per-test (``tmp_path``/``monkeypatch``) or stateless, and the
+synthetic HOME below is a per-process ``mkdtemp``, so the suite runs
+safely in parallel under pytest-xdist (``pytest -n auto``).
+"""
 
 from __future__ import annotations
 
@@ -37,8 +42,18 @@ atexit.register(lambda: shutil.rmtree(_TEST_HOME_ROOT, ignore_errors=True))
 
 
 @pytest.fixture
-def db(tmp_path):
-    """Fresh SQLite database per test."""
+def db():
+    """Fresh in-memory SQLite database per test — no disk/fsync cost."""
+    from syke.db import SykeDB
+
+    with SykeDB(":memory:") as database:
+        yield database
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    """File-backed database for tests that reopen the path from a second
+    connection or otherwise need the DB to exist on disk."""
     from syke.db import SykeDB
 
     with SykeDB(tmp_path / "test.db") as database:
@@ -50,9 +65,9 @@ def user_id():
     return "test_user"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Click CLI test runner."""
+    """Click CLI test runner. Stateless across invokes, so built once."""
     return CliRunner()
 
 
@@ -14,6 +14,11 @@ from typing import Any
 
 from uuid_extensions import uuid7
 
+# Shared encoder for the per-line JSONL loops below: JSONEncoder.encode skips
+# the dumps() wrapper's argument handling on every record, and the compact
+# separators match what the adapters parse in production.
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 
 def write_claude_code_session(
     base_dir: Path,
@@ -104,7 +109,7 @@ def write_claude_code_session(
         if parent_session_id:
             record["isSidechain"] = True
 
-        lines.append(json.dumps(record))
+        lines.append(_ENCODER.encode(record))
 
     fpath.write_text("\n".join(lines) + "\n", encoding="utf-8")
     return fpath
@@ -142,7 +147,7 @@ def write_codex_session(
         "timestamp": ts.isoformat(),
         "payload": {"cwd": "/tmp/test-project", "git": {"branch": "main"}},
     }
-    lines.append(json.dumps(meta))
+    lines.append(_ENCODER.encode(meta))
 
     for i, turn in enumerate(turns):
         turn_ts = (ts + timedelta(seconds=i + 1)).isoformat()
@@ -159,7 +164,7 @@ def write_codex_session(
                 "content": [{"type": content_type, "text": text}],
             },
         }
-        lines.append(json.dumps(record))
+        lines.append(_ENCODER.encode(record))
 
         for tool in turn.get("tools", []):
             call_id = tool.get("call_id", f"call_{i}_{uuid7()}")
@@ -173,7 +178,7 @@ def write_codex_session(
                     "arguments": json.dumps(tool.get("input", {})),
                 },
             }
-            lines.append(json.dumps(tool_use))
+            lines.append(_ENCODER.encode(tool_use))
 
             tool_result: dict[str, Any] = {
                 "type": "response_item",
@@ -184,7 +189,7 @@ def write_codex_session(
                     "output": tool.get("output", "ok"),
                 },
             }
-            lines.append(json.dumps(tool_result))
+            lines.append(_ENCODER.encode(tool_result))
 
     fpath.write_text("\n".join(lines) + "\n", encoding="utf-8")
     return fpath
@@ -554,7 +559,7 @@ def write_copilot_cli_session(
     workspace_path = session_dir / "workspace.yaml"
 
     lines = [
-        json.dumps(
+        _ENCODER.encode(
             {
                 "type": "session.start",
                 "data": {"sessionId": session_id, "context": {"cwd": "/tmp/project"}},
@@ -570,7 +575,7 @@ def write_copilot_cli_session(
         user_id = str(uuid7())
         user_ts = (ts + timedelta(seconds=idx * 2 + 1)).isoformat()
         lines.append(
-            json.dumps(
+            _ENCODER.encode(
                 {
                     "type": "user.message",
                     "data": {"text": turn["user"]},
@@ -585,7 +590,7 @@ def write_copilot_cli_session(
         for tool in turn.get("tools", []):
             tool_id = str(uuid7())
             lines.append(
-                json.dumps(
+                _ENCODER.encode(
                     {
                         "type": "tool.call",
                         "data": {
@@ -605,7 +610,7 @@ def write_copilot_cli_session(
 
             result_id = str(uuid7())
             lines.append(
-                json.dumps(
+                _ENCODER.encode(
                     {
                         "type": "tool.result",
                         "data": {
@@ -625,7 +630,7 @@ def write_copilot_cli_session(
 
         assistant_id = str(uuid7())
         lines.append(
-            json.dumps(
+            _ENCODER.encode(
                 {
                     "type": "assistant.message",
                     "data": {"text": turn["assistant"]},
@@ -638,7 +643,7 @@ def write_copilot_cli_session(
         previous_id = assistant_id
 
         lines.append(
-            json.dumps(
+            _ENCODER.encode(
                 {
                     "type": "assistant.turn_end",
                     "data": {},
@@ -167,6 +167,9 @@ def main():
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
+        # Own session: a Ctrl-C on the harness must not reach Pi mid-protocol;
+        # cleanup below terminates it explicitly.
+        start_new_session=True,
     )
 
     collector = StdoutCollector(proc)
@@ -1,15 +1,19 @@
+import functools
 import inspect
 import logging
 import os
 import plistlib
 import signal
-import subprocess
+from collections import namedtuple
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from syke.daemon.daemon import (
+    _DEFAULT_UNINSTALLERS,
+    _PLATFORM_INSTALLERS,
+    _PLATFORM_UNINSTALLERS,
     LAUNCHD_LABEL,
     SYSTEMD_SERVICE_NAME,
     DaemonFormatter,
@@ -42,6 +46,10 @@ from syke.daemon.daemon import (
 )
 from syke.runtime.locator import SykeRuntimeDescriptor
 
+# Stand-in for subprocess.CompletedProcess in fakes — the code under test only
+# reads args/returncode/stdout/stderr, and namedtuple construction is cheaper.
+_Fake = namedtuple("_Fake", "args returncode stdout stderr")
+
 
 def test_daemon_formatter_uses_explicit_utc_timestamp():
     record = logging.LogRecord(
@@ -59,14 +67,21 @@ def test_daemon_formatter_uses_explicit_utc_timestamp():
     assert DaemonFormatter().format(record) == "2026-04-13 22:40:00 UTC START user=sax interval=60s"
 
 
+@functools.cache
+def _supported_params(func) -> frozenset[str]:
+    """Memoized parameter names — inspect.signature is costly per call."""
+    return frozenset(inspect.signature(func).parameters)
+
+
 def _call_with_supported_args(func, **kwargs):
-    params = inspect.signature(func).parameters
+    params = _supported_params(func)
     call_kwargs = {k: v for k, v in kwargs.items() if k in params}
     return func(**call_kwargs)
 
 
 def _read_pid_value(pid_path):
-    return Path(pid_path).read_text(encoding="utf-8").strip()
+    # PID files are ASCII digits; bytes I/O skips the text-codec path.
+    return Path(pid_path).read_bytes().strip().decode("ascii")
 
 
 def test_cycle_failure_backoff_distinguishes_config_from_transient_errors():
@@ -79,92 +94,58 @@ def test_cycle_failure_backoff_distinguishes_config_from_transient_errors():
 # --- PID lifecycle ---
 
 
-def test_daemon_pid_lifecycle_write_read_remove(monkeypatch, tmp_path):
+@pytest.fixture
+def pid_env(monkeypatch, tmp_path):
+    """PIDFILE pointed at a per-test path — shared by the pid-state tests."""
     pid_path = tmp_path / "syke.pid"
-    monkeypatch.setattr("syke.daemon.daemon.PIDFILE", Path(pid_path))
+    monkeypatch.setattr("syke.daemon.daemon.PIDFILE", pid_path)
+    return pid_path
+
 
+def test_daemon_pid_lifecycle_write_read_remove(pid_env):
     _write_pid()
-    assert pid_path.exists()
-    assert _read_pid_value(pid_path).isdigit()
+    assert pid_env.exists()
+    assert _read_pid_value(pid_env).isdigit()
 
-    with patch("os.kill", return_value=None):
+    with patch("syke.daemon.daemon._probe_pid", return_value=None):
         running, _pid = is_running()
         assert running is True
 
     _remove_pid()
-    assert not pid_path.exists()
-
-
-def test_daemon_stale_pid_cleanup(monkeypatch, tmp_path):
-    pid_path = tmp_path / "syke.pid"
-    monkeypatch.setattr("syke.daemon.daemon.PIDFILE", Path(pid_path))
-
-    pid_path.write_text("91919", encoding="utf-8")
-    assert pid_path.exists()
-
-    with patch("os.kill", side_effect=ProcessLookupError):
-        running, _ = is_running()
-        assert running is False
-
-    assert not pid_path.exists()
-
-
-def test_daemon_pid_permission_denied_treated_as_running(monkeypatch, tmp_path):
-    pid_path = tmp_path / "syke.pid"
-    monkeypatch.setattr("syke.daemon.daemon.PIDFILE", Path(pid_path))
-
-    pid_path.write_text("91919", encoding="utf-8")
-
-    with patch("os.kill", side_effect=PermissionError):
-        running, pid = is_running()
-
-    assert running is True
-    assert pid == 91919
-    assert pid_path.exists()
-
-
-def test_daemon_pid_permission_denied_with_non_syke_process_cleans_stale_pid(monkeypatch, tmp_path):
-    pid_path = tmp_path / "syke.pid"
-    monkeypatch.setattr("syke.daemon.daemon.PIDFILE", Path(pid_path))
-
-    pid_path.write_text("91919", encoding="utf-8")
-
-    with (
-        patch("os.kill", side_effect=PermissionError),
-        patch("syke.daemon.daemon._pid_looks_like_syke", return_value=False),
-    ):
-        running, pid = is_running()
-
-    assert running is False
-    assert pid is None
-    assert not pid_path.exists()
-
+    assert not pid_env.exists()
 
-def test_daemon_pid_reused_by_non_syke_process_cleans_stale_pid(monkeypatch, tmp_path):
-    pid_path = tmp_path / "syke.pid"
-    monkeypatch.setattr("syke.daemon.daemon.PIDFILE", Path(pid_path))
 
-    pid_path.write_text("91919", encoding="utf-8")
+@pytest.mark.parametrize(
+    ("probe", "looks_like_syke", "expect_running", "expect_pid", "expect_file"),
+    [
+        pytest.param(ProcessLookupError, None, False, None, False, id="stale-pid"),
+        pytest.param(PermissionError, None, True, 91919, True, id="permission-denied-running"),
+        pytest.param(PermissionError, False, False, None, False, id="permission-denied-non-syke"),
+        pytest.param(None, False, False, None, False, id="pid-reused-by-non-syke"),
+    ],
+)
+def test_is_running_pid_states(
+    pid_env, monkeypatch, probe, looks_like_syke, expect_running, expect_pid, expect_file
+):
+    pid_env.write_bytes(b"91919")
+    monkeypatch.setattr("syke.daemon.daemon._probe_pid", Mock(side_effect=probe, return_value=None))
+    if looks_like_syke is not None:
+        monkeypatch.setattr(
+            "syke.daemon.daemon._pid_looks_like_syke", Mock(return_value=looks_like_syke)
+        )
 
-    with (
-        patch("os.kill", return_value=None),
-        patch("syke.daemon.daemon._pid_looks_like_syke", return_value=False),
-    ):
-        running, pid = is_running()
+    running, pid = is_running()
 
-    assert running is False
-    assert pid is None
-    assert not pid_path.exists()
+    assert running is expect_running
+    assert pid == expect_pid
+    assert pid_env.exists() is expect_file
 
 
-def test_daemon_stale_pid_cleanup_unlink_failure_is_nonfatal(monkeypatch, tmp_path):
-    pid_path = tmp_path / "syke.pid"
-    monkeypatch.setattr("syke.daemon.daemon.PIDFILE", Path(pid_path))
-
-    pid_path.write_text("91919", encoding="utf-8")
+def test_daemon_stale_pid_cleanup_unlink_failure_is_nonfatal(pid_env):
+    pid_env.write_bytes(b"91919")
 
     with (
-        patch("os.kill", side_effect=ProcessLookupError),
+        patch("syke.daemon.daemon._probe_pid", side_effect=ProcessLookupError),
         patch("syke.daemon.daemon._unlink_pidfile", return_value=False) as unlink_pidfile,
     ):
         running, pid = is_running()
@@ -177,20 +158,18 @@ def test_daemon_stale_pid_cleanup_unlink_failure_is_nonfatal(monkeypatch, tmp_pa
 def test_pid_identity_requires_daemon_run_signature() -> None:
     with patch(
         "subprocess.run",
-        return_value=subprocess.CompletedProcess(
+        return_value=_Fake(
             ["ps"],
             0,
-            stdout="/usr/local/bin/syke --user test daemon run --interval 900\n",
-            stderr="",
+            "/usr/local/bin/syke --user test daemon run --interval 900\n",
+            "",
         ),
     ):
         assert _pid_looks_like_syke(1234) is True
 
     with patch(
         "subprocess.run",
-        return_value=subprocess.CompletedProcess(
-            ["ps"], 0, stdout="/usr/local/bin/syke ask what changed\n", stderr=""
-        ),
+        return_value=_Fake(["ps"], 0, "/usr/local/bin/syke ask what changed\n", ""),
     ):
         assert _pid_looks_like_syke(1234) is False
 
@@ -208,9 +187,7 @@ def test_pid_safety_accepts_launchd_attestation_when_ps_identity_is_uncertain(mo
         assert _pid_is_safe_daemon_target(4242) is True
 
 
-def test_daemon_process_state_falls_back_to_launchd_when_pidfile_is_missing(monkeypatch, tmp_path):
-    pid_path = tmp_path / "syke.pid"
-    monkeypatch.setattr("syke.daemon.daemon.PIDFILE", Path(pid_path))
+def test_daemon_process_state_falls_back_to_launchd_when_pidfile_is_missing(pid_env, monkeypatch):
     monkeypatch.setattr("sys.platform", "darwin")
 
     with (
@@ -225,9 +202,7 @@ def test_daemon_process_state_falls_back_to_launchd_when_pidfile_is_missing(monk
     assert state == {"running": True, "pid": 4242, "source": "launchd"}
 
 
-def test_daemon_process_state_does_not_trust_stale_launchd_metadata(monkeypatch, tmp_path):
-    pid_path = tmp_path / "syke.pid"
-    monkeypatch.setattr("syke.daemon.daemon.PIDFILE", Path(pid_path))
+def test_daemon_process_state_does_not_trust_stale_launchd_metadata(pid_env, monkeypatch):
     monkeypatch.setattr("sys.platform", "darwin")
 
     with patch(
@@ -282,24 +257,36 @@ def test_daemon_signal_handler_stops_on_sigterm(sig):
 # --- Plist generation ---
 
 
-def test_generate_plist_uses_stable_syke_launcher():
+@pytest.fixture
+def stable_launcher(monkeypatch):
+    """Pin runtime resolution to a fixed stable launcher path.
+
+    Replaces the resolve-runtime + ensure-launcher patch stack that the plist
+    and systemd tests otherwise rebuild individually.
+    """
     runtime = SykeRuntimeDescriptor(
         mode="external_cli",
         syke_command=("/usr/local/bin/syke",),
         target_path=Path("/usr/local/bin/syke"),
     )
+    launcher = Path("/Users/me/.syke/bin/syke")
+    monkeypatch.setattr("syke.runtime.locator.resolve_background_syke_runtime", lambda: runtime)
+    monkeypatch.setattr("syke.runtime.locator.resolve_syke_runtime", lambda: runtime)
+    monkeypatch.setattr("syke.runtime.locator.ensure_syke_launcher", lambda _runtime: launcher)
+    return launcher
 
-    with (
-        patch("syke.runtime.locator.resolve_background_syke_runtime", return_value=runtime),
-        patch(
-            "syke.runtime.locator.ensure_syke_launcher",
-            return_value=Path("/Users/me/.syke/bin/syke"),
-        ),
-    ):
-        plist = _call_with_supported_args(generate_plist, user_id="testuser", interval=900)
 
-    assert "/Users/me/.syke/bin/syke" in plist
+def test_generate_plist_content_invariants(stable_launcher, monkeypatch):
+    """One rendered plist covers the launcher, interval, and secret checks."""
+    secret = "sk_test_should_not_appear"
+    monkeypatch.setenv("SYKE_API_KEY", secret)
+
+    plist = _call_with_supported_args(generate_plist, user_id="testuser", interval=900)
+
+    assert str(stable_launcher) in plist
     assert "/usr/local/bin/syke" not in plist
+    assert "900" in plist
+    assert secret not in plist
 
 
 # --- TCC protection ---
@@ -335,33 +322,38 @@ def test_generate_plist_rejects_tcc_path_when_no_alternative():
 
 def test_install_and_start_passes_interval_to_launchd(monkeypatch):
     monkeypatch.setattr("sys.platform", "darwin")
+    launchd_mock = Mock()
+    monkeypatch.setitem(_PLATFORM_INSTALLERS, "darwin", launchd_mock)
 
-    with patch("syke.daemon.daemon.install_launchd") as launchd_mock:
-        _call_with_supported_args(install_and_start, user_id="testuser", interval=1234)
+    _call_with_supported_args(install_and_start, user_id="testuser", interval=1234)
 
     launchd_mock.assert_called_once_with("testuser", interval=1234)
 
 
-def test_install_launchd_writes_interval_to_plist(tmp_path, monkeypatch):
+@pytest.mark.parametrize(
+    "bootstrap_supported",
+    [True, False],
+    ids=["bootstrap", "legacy-load-fallback"],
+)
+def test_install_launchd_registration_flow(
+    stable_launcher, tmp_path, monkeypatch, bootstrap_supported
+):
+    """One install covers plist content, stale-registration clearing, and the
+    bootstrap-vs-legacy-load dispatch (parametrized on launchctl support)."""
     plist_path = tmp_path / "com.syke.daemon.plist"
     log_path = tmp_path / "daemon.log"
-    runtime = SykeRuntimeDescriptor(
-        mode="external_cli",
-        syke_command=("/usr/local/bin/syke",),
-        target_path=Path("/usr/local/bin/syke"),
-    )
+    calls: list[list[str]] = []
+
+    def _fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        if not bootstrap_supported and cmd[:2] == ["launchctl", "bootstrap"]:
+            return _Fake(cmd, 1, "", "unknown subcommand")
+        return _Fake(cmd, 0, "", "")
 
     monkeypatch.setattr("syke.daemon.daemon.PLIST_PATH", plist_path)
     monkeypatch.setattr("syke.daemon.daemon.LOG_PATH", log_path)
 
-    with (
-        patch("syke.runtime.locator.resolve_background_syke_runtime", return_value=runtime),
-        patch(
-            "syke.runtime.locator.ensure_syke_launcher",
-            return_value=Path("/Users/me/.syke/bin/syke"),
-        ),
-        patch("subprocess.run", return_value=subprocess.CompletedProcess(["launchctl"], 0)),
-    ):
+    with patch("subprocess.run", side_effect=_fake_run):
         install_launchd("testuser", interval=1234)
 
     plist = plist_path.read_text(encoding="utf-8")
@@ -371,68 +363,13 @@ def test_install_launchd_writes_interval_to_plist(tmp_path, monkeypatch):
     assert payload["RunAtLoad"] is True
     assert payload["ThrottleInterval"] == 30
 
-
-def test_install_launchd_clears_stale_registration_before_bootstrap(tmp_path, monkeypatch):
-    plist_path = tmp_path / "com.syke.daemon.plist"
-    log_path = tmp_path / "daemon.log"
-    runtime = SykeRuntimeDescriptor(
-        mode="external_cli",
-        syke_command=("/usr/local/bin/syke",),
-        target_path=Path("/usr/local/bin/syke"),
-    )
-    calls: list[list[str]] = []
-
-    def _fake_run(cmd, **kwargs):
-        calls.append(cmd)
-        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
-
-    monkeypatch.setattr("syke.daemon.daemon.PLIST_PATH", plist_path)
-    monkeypatch.setattr("syke.daemon.daemon.LOG_PATH", log_path)
-
-    with (
-        patch("syke.runtime.locator.resolve_background_syke_runtime", return_value=runtime),
-        patch(
-            "syke.runtime.locator.ensure_syke_launcher",
-            return_value=Path("/Users/me/.syke/bin/syke"),
-        ),
-        patch("subprocess.run", side_effect=_fake_run),
-    ):
-        install_launchd("testuser", interval=900)
-
     assert ["launchctl", "remove", "com.syke.daemon"] in calls
-    assert calls[-1] == ["launchctl", "bootstrap", f"gui/{os.getuid()}", str(plist_path)]
-
-
-def test_install_launchd_falls_back_to_load_when_bootstrap_is_unsupported(tmp_path, monkeypatch):
-    plist_path = tmp_path / "com.syke.daemon.plist"
-    log_path = tmp_path / "daemon.log"
-    runtime = SykeRuntimeDescriptor(
-        mode="external_cli",
-        syke_command=("/usr/local/bin/syke",),
-        target_path=Path("/usr/local/bin/syke"),
-    )
-    calls: list[list[str]] = []
-
-    def _fake_run(cmd, **kwargs):
-        calls.append(cmd)
-        if cmd[:3] == ["launchctl", "bootstrap", f"gui/{os.getuid()}"]:
-            return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="unknown subcommand")
-        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
-
-    monkeypatch.setattr("syke.daemon.daemon.PLIST_PATH", plist_path)
-    monkeypatch.setattr("syke.daemon.daemon.LOG_PATH", log_path)
-
-    with (
-        patch("syke.runtime.locator.resolve_background_syke_runtime", return_value=runtime),
-        patch(
-            "syke.runtime.locator.ensure_syke_launcher",
-            return_value=Path("/Users/me/.syke/bin/syke"),
-        ),
-        patch("subprocess.run", side_effect=_fake_run),
-    ):
-        install_launchd("testuser", interval=900)
-
-    assert ["launchctl", "load", str(plist_path)] in calls
+    bootstrap_cmd = ["launchctl", "bootstrap", f"gui/{os.getuid()}", str(plist_path)]
+    if bootstrap_supported:
+        assert calls[-1] == bootstrap_cmd
+    else:
+        assert bootstrap_cmd in calls
+        assert calls[-1] == ["launchctl", "load", str(plist_path)]
 
 
 def test_uninstall_launchd_clears_stale_registration_when_plist_missing(monkeypatch, tmp_path):
@@ -442,8 +379,8 @@ def test_uninstall_launchd_clears_stale_registration_when_plist_missing(monkeypa
     def _fake_run(cmd, **kwargs):
         calls.append(cmd)
         if cmd == ["launchctl", "remove", "com.syke.daemon"]:
-            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
-        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="")
+            return _Fake(cmd, 0, "", "")
+        return _Fake(cmd, 1, "", "")
 
     monkeypatch.setattr("syke.daemon.daemon.PLIST_PATH", plist_path)
 
@@ -481,13 +418,13 @@ def test_launchd_status_prefers_service_target_print(monkeypatch):
     def _fake_run(cmd, **kwargs):
         calls.append(cmd)
         if cmd[:2] == ["launchctl", "print"]:
-            return subprocess.CompletedProcess(
+            return _Fake(
                 cmd,
                 0,
-                stdout="state = running\nprogram = /Users/me/.syke/bin/syke\n",
-                stderr="",
+                "state = running\nprogram = /Users/me/.syke/bin/syke\n",
+                "",
             )
-        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="")
+        return _Fake(cmd, 1, "", "")
 
     with patch("subprocess.run", side_effect=_fake_run):
         status = launchd_status()
@@ -525,64 +462,6 @@ def test_launchd_metadata_parses_tabular_launchctl_list_output(monkeypatch, tmp_
     assert metadata["stale"] is False
 
 
-def test_generate_plist_auto_resolves_safe_alternative():
-    runtime = SykeRuntimeDescriptor(
-        mode="external_cli",
-        syke_command=("/Users/me/.local/bin/syke",),
-        target_path=Path("/Users/me/.local/bin/syke"),
-    )
-
-    with (
-        patch("syke.runtime.locator.resolve_background_syke_runtime", return_value=runtime),
-        patch(
-            "syke.runtime.locator.ensure_syke_launcher",
-            return_value=Path("/Users/me/.syke/bin/syke"),
-        ),
-    ):
-        plist = _call_with_supported_args(generate_plist, user_id="testuser", interval=900)
-
-    assert "/Users/me/.syke/bin/syke" in plist
-
-
-def test_generate_plist_never_injects_api_key(monkeypatch):
-    secret = "sk_test_should_not_appear"
-    monkeypatch.setenv("SYKE_API_KEY", secret)
-    runtime = SykeRuntimeDescriptor(
-        mode="external_cli",
-        syke_command=("/usr/local/bin/syke",),
-        target_path=Path("/usr/local/bin/syke"),
-    )
-
-    with (
-        patch("syke.runtime.locator.resolve_background_syke_runtime", return_value=runtime),
-        patch(
-            "syke.runtime.locator.ensure_syke_launcher",
-            return_value=Path("/Users/me/.syke/bin/syke"),
-        ),
-    ):
-        plist = _call_with_supported_args(generate_plist, user_id="testuser", interval=900)
-
-    assert secret not in plist
-
-
-def test_generate_plist_contains_interval_value():
-    runtime = SykeRuntimeDescriptor(
-        mode="external_cli",
-        syke_command=("/usr/local/bin/syke",),
-        target_path=Path("/usr/local/bin/syke"),
-    )
-
-    with (
-        patch("syke.runtime.locator.resolve_background_syke_runtime", return_value=runtime),
-        patch(
-            "syke.runtime.locator.ensure_syke_launcher",
-            return_value=Path("/Users/me/.syke/bin/syke"),
-        ),
-    ):
-        plist = _call_with_supported_args(generate_plist, user_id="testuser", interval=900)
-    assert "900" in plist
-
-
 # --- systemd backend ---
 
 
@@ -611,7 +490,7 @@ def test_install_systemd_user_writes_enables_and_starts_unit(monkeypatch, tmp_pa
 
     def _fake_systemctl(args, **_kwargs):
         calls.append(args)
-        return subprocess.CompletedProcess(["systemctl", "--user", *args], 0, stdout="", stderr="")
+        return _Fake(["systemctl", "--user", *args], 0, "", "")
 
     monkeypatch.setattr("syke.daemon.daemon.SYSTEMD_UNIT_PATH", unit_path)
     monkeypatch.setattr("syke.daemon.daemon.LOG_PATH", tmp_path / "daemon.log")
@@ -637,7 +516,7 @@ def test_uninstall_systemd_user_stops_removes_and_reloads(monkeypatch, tmp_path)
 
     def _fake_systemctl(args, **_kwargs):
         calls.append(args)
-        return subprocess.CompletedProcess(["systemctl", "--user", *args], 0, stdout="", stderr="")
+        return _Fake(["systemctl", "--user", *args], 0, "", "")
 
     monkeypatch.setattr("syke.daemon.daemon.SYSTEMD_UNIT_PATH", unit_path)
     monkeypatch.setattr("syke.daemon.daemon.shutil.which", lambda _name: "/bin/systemctl")
@@ -680,25 +559,47 @@ def test_systemd_metadata_parses_status_and_unit(monkeypatch, tmp_path):
 # --- Cron backend ---
 
 
+class FakeCron:
+    """In-memory crontab spool with a call log.
+
+    ``text`` is the current crontab (None = no crontab installed); writes land
+    back on the instance, and ``calls`` records each backend operation so
+    tests can assert on call shape without MagicMock dispatch.
+    """
+
+    def __init__(self) -> None:
+        self.text: str | None = None
+        self.calls: list[tuple[str, str | None]] = []
+
+    def read(self) -> str | None:
+        self.calls.append(("read", None))
+        return self.text
+
+    def write(self, text: str) -> None:
+        self.calls.append(("write", text))
+        self.text = text
+
+
+@pytest.fixture
+def fake_crontab(monkeypatch):
+    """Swap the crontab backend seam for an in-memory FakeCron."""
+    cron = FakeCron()
+    monkeypatch.setattr("syke.daemon.daemon._read_crontab", cron.read)
+    monkeypatch.setattr("syke.daemon.daemon._write_crontab", cron.write)
+    return cron
+
+
 @pytest.mark.parametrize(
     "existing_crontab",
     ["0 * * * * /usr/bin/true\n", None],
 )
-def test_install_cron_writes_entry(existing_crontab):
-    calls = []
+def test_install_cron_writes_entry(fake_crontab, existing_crontab):
     runtime = SykeRuntimeDescriptor(
         mode="external_cli",
         syke_command=("/usr/local/bin/syke",),
         target_path=Path("/usr/local/bin/syke"),
     )
-
-    def _fake_run(cmd, **kwargs):
-        calls.append((cmd, kwargs))
-        if cmd == ["crontab", "-l"]:
-            if existing_crontab is None:
-                return subprocess.CompletedProcess(cmd, 1, stdout="", stderr="no crontab for user")
-            return subprocess.CompletedProcess(cmd, 0, stdout=existing_crontab, stderr="")
-        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+    fake_crontab.text = existing_crontab
 
     with (
         patch("syke.runtime.locator.resolve_syke_runtime", return_value=runtime),
@@ -706,39 +607,29 @@ def test_install_cron_writes_entry(existing_crontab):
             "syke.runtime.locator.ensure_syke_launcher",
             return_value=Path("/Users/me/.syke/bin/syke"),
         ),
-        patch("subprocess.run", side_effect=_fake_run),
     ):
         _call_with_supported_args(install_cron, user_id="testuser", interval=900)
 
-    assert any(cmd == ["crontab", "-"] for cmd, _ in calls)
-    joined_inputs = "\n".join(str(kwargs.get("input", "")) for _, kwargs in calls)
-    assert "syke" in joined_inputs.lower()
+    written = fake_crontab.text or ""
+    assert "syke" in written.lower()
+    if existing_crontab:
+        assert "0 * * * * /usr/bin/true" in written
 
 
 @pytest.mark.parametrize("has_entry", [True, False])
-def test_uninstall_cron_removes_entry(has_entry):
+def test_uninstall_cron_removes_entry(fake_crontab, has_entry):
     existing = (
         "*/15 * * * * /usr/local/bin/syke --user testuser sync >> /tmp/syke.log 2>&1 # syke-daemon\n0 * * * * /usr/bin/true\n"
         if has_entry
         else "0 * * * * /usr/bin/true\n"
     )
-    calls = []
-
-    def _fake_run(cmd, **kwargs):
-        calls.append((cmd, kwargs))
-        if cmd == ["crontab", "-l"]:
-            return subprocess.CompletedProcess(cmd, 0, stdout=existing, stderr="")
-        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+    fake_crontab.text = existing
 
-    with patch("subprocess.run", side_effect=_fake_run):
-        _call_with_supported_args(uninstall_cron, user_id="testuser")
+    removed = _call_with_supported_args(uninstall_cron, user_id="testuser")
 
-    updates = [kwargs.get("input", "") for cmd, kwargs in calls if cmd == ["crontab", "-"]]
-    if has_entry:
-        assert updates
-        assert all("syke daemon run" not in str(text) for text in updates)
-    else:
-        assert (not updates) or all("syke daemon run" not in str(text) for text in updates)
+    assert removed is has_entry
+    assert "# syke-daemon" not in (fake_crontab.text or "")
+    assert "0 * * * * /usr/bin/true" in (fake_crontab.text or "")
 
 
 @pytest.mark.parametrize(
@@ -749,67 +640,45 @@ def test_uninstall_cron_removes_entry(has_entry):
         ("", False),
     ],
 )
-def test_cron_is_running_states(crontab_text, expected):
-    with patch(
-        "subprocess.run",
-        return_value=subprocess.CompletedProcess(
-            ["crontab", "-l"], 0, stdout=crontab_text, stderr=""
-        ),
-    ):
-        actual, _ = _call_with_supported_args(cron_is_running, user_id="testuser")
-    assert actual is expected
+def test_cron_is_running_states(fake_crontab, crontab_text, expected):
+    fake_crontab.text = crontab_text
 
+    actual, _ = _call_with_supported_args(cron_is_running, user_id="testuser")
 
-# --- Platform dispatch ---
+    assert actual is expected
 
 
-@pytest.mark.parametrize(
-    "platform_name,expect_systemd",
-    [("darwin", False), ("linux", True)],
-)
-def test_install_dispatch(platform_name, expect_systemd, monkeypatch):
-    monkeypatch.setattr("sys.platform", platform_name)
+# --- Platform dispatch ---
 
-    with (
-        patch("syke.daemon.daemon.install_launchd", create=True) as launchd_mock,
-        patch("syke.daemon.daemon.install_systemd_user") as systemd_mock,
-    ):
-        _call_with_supported_args(install_and_start, user_id="testuser", interval=900)
 
-    if expect_systemd:
-        systemd_mock.assert_called_once_with("testuser", interval=900)
-        launchd_mock.assert_not_called()
-    else:
-        launchd_mock.assert_called_once_with("testuser", interval=900)
-        systemd_mock.assert_not_called()
+def test_platform_dispatch_tables():
+    """Dispatch is a dict lookup; assert the table instead of patching it."""
+    assert _PLATFORM_INSTALLERS["darwin"] is install_launchd
+    assert _PLATFORM_INSTALLERS.get("linux", install_systemd_user) is install_systemd_user
+    assert _PLATFORM_UNINSTALLERS["darwin"] == (uninstall_launchd,)
+    assert _PLATFORM_UNINSTALLERS.get("linux", _DEFAULT_UNINSTALLERS) == (
+        uninstall_systemd_user,
+        uninstall_cron,
+    )
 
 
-@pytest.mark.parametrize(
-    "platform_name,expect_systemd",
-    [("darwin", False), ("linux", True)],
-)
-def test_stop_dispatch(platform_name, expect_systemd, monkeypatch):
-    monkeypatch.setattr("sys.platform", platform_name)
+def test_stop_dispatch_runs_default_uninstallers_in_order(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr("sys.platform", "linux")
+    monkeypatch.setattr("syke.daemon.daemon.is_running", lambda: (False, None))
+    monkeypatch.setattr(
+        "syke.daemon.daemon._DEFAULT_UNINSTALLERS",
+        (lambda: calls.append("systemd"), lambda: calls.append("cron")),
+    )
 
-    with (
-        patch("syke.daemon.daemon.is_running", return_value=(False, None)),
-        patch("syke.daemon.daemon.uninstall_cron") as cron_mock,
-        patch("syke.daemon.daemon.uninstall_launchd") as launchd_mock,
-        patch("syke.daemon.daemon.uninstall_systemd_user") as systemd_mock,
-    ):
-        _call_with_supported_args(stop_and_unload, user_id="testuser")
+    _call_with_supported_args(stop_and_unload, user_id="testuser")
 
-    if expect_systemd:
-        systemd_mock.assert_called_once_with()
-        cron_mock.assert_called_once_with()
-        launchd_mock.assert_not_called()
-    else:
-        launchd_mock.assert_called_once_with()
-        systemd_mock.assert_not_called()
-        cron_mock.assert_not_called()
+    assert calls == ["systemd", "cron"]
 
 
 def test_daemon_cycle_ordering():
+    from syke.db import SykeDB
+
     daemon = SykeDaemon("testuser", interval=900)
     order: list[str] = []
 
@@ -825,7 +694,9 @@ def test_daemon_cycle_ordering():
             daemon, "_distribute", side_effect=lambda _db, _result: order.append("distribute")
         ),
     ):
-        daemon._daemon_cycle(MagicMock())
+        # spec-bound: attribute access resolves against SykeDB instead of
+        # materializing child mocks, and typos in the cycle fail loudly.
+        daemon._daemon_cycle(Mock(spec=SykeDB))
 
     assert order == ["health", "heal", "synthesize", "distribute"]
 
@@ -841,12 +712,13 @@ def test_stop_and_unload_stops_running_process_before_unloading(monkeypatch):
         _ = (pid, sig)
         calls.append("kill")
 
+    monkeypatch.setitem(_PLATFORM_UNINSTALLERS, "darwin", (_unload,))
+
     with (
         patch(
             "syke.daemon.daemon.is_running",
             side_effect=[(True, 123), (False, None), (False, None)],
         ),
-        patch("syke.daemon.daemon.uninstall_launchd", side_effect=_unload),
         patch("syke.daemon.daemon._pid_is_safe_daemon_target", return_value=True),
         patch("os.kill", side_effect=_kill),
         patch("time.monotonic", return_value=0.0),
@@ -864,9 +736,10 @@ def test_stop_and_unload_refuses_to_kill_unverified_pid(monkeypatch):
     def _unload() -> None:
         calls.append("unload")
 
+    monkeypatch.setitem(_PLATFORM_UNINSTALLERS, "darwin", (_unload,))
+
     with (
         patch("syke.daemon.daemon.is_running", return_value=(True, 123)),
-        patch("syke.daemon.daemon.uninstall_launchd", side_effect=_unload),
         patch("syke.daemon.daemon._pid_is_safe_daemon_target", return_value=False),
         patch("os.kill") as kill_mock,
     ):
@@ -1,26 +1,46 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
 
 import syke
-from syke.config import PROJECT_ROOT
-from syke.db import SykeDB
-from syke.distribution import refresh_distribution
-from syke.distribution.context_files import (
-    _get_skill_content,
-    distribute_memex,
-    install_skill,
-)
+from syke.distribution.context_files import distribute_all_memex, distribute_memex
 from syke.models import Memory
 
+if TYPE_CHECKING:
+    from syke.db import SykeDB
+
+# Skill-contract fragments checked in one alternation pass over SKILL.md
+# instead of a substring scan per fragment.
+_SKILL_CONTRACT_FRAGMENTS = (
+    "~/.syke/MEMEX.md",
+    f"version: {syke.__version__}",
+    "Node.js 20+ (22 LTS recommended)",
+)
+_SKILL_CONTRACT_RE = re.compile("|".join(map(re.escape, _SKILL_CONTRACT_FRAGMENTS)))
+
+
+@pytest.fixture(scope="session")
+def memex_template() -> Memory:
+    """Memex-row template built once per session; tests derive variants via
+    model_copy(update=...) instead of re-running full model validation."""
+    return Memory(
+        id="memex-template",
+        user_id="template",
+        content="",
+        source_event_ids=["__memex__"],
+    )
+
 
 def test_distribute_memex_does_not_overwrite_workspace_file(
     db: SykeDB,
     user_id: str,
     tmp_path: Path,
+    memex_template: Memory,
 ) -> None:
     """distribute_memex no longer writes to ~/.syke/MEMEX.md.
 
@@ -28,23 +48,28 @@ def test_distribute_memex_does_not_overwrite_workspace_file(
     Distribution only reports whether content exists.
     """
     _ = db.insert_memory(
-        Memory(
-            id="memex-001",
-            user_id=user_id,
-            content="# Memex — test_user\n\n## Identity\nTest identity.",
-            source_event_ids=["__memex__"],
+        memex_template.model_copy(
+            update={
+                "id": "memex-001",
+                "user_id": user_id,
+                "content": "# Memex — test_user\n\n## Identity\nTest identity.",
+            }
         )
     )
 
-    # Simulate workspace MEMEX.md existing (written by synthesis)
+    # Simulate workspace MEMEX.md existing (written by synthesis) with a real
+    # file — patching Path.exists class-wide would intercept every Path in
+    # the process.
     from syke.runtime.workspace import MEMEX_PATH
 
-    with patch.object(Path, "exists", return_value=True):
-        with patch("syke.runtime.workspace.MEMEX_PATH", MEMEX_PATH):
-            out_path = distribute_memex(db, user_id)
+    MEMEX_PATH.write_text("# Memex — test_user\n", encoding="utf-8")
+    before = MEMEX_PATH.read_text(encoding="utf-8")
+
+    out_path = distribute_memex(db, user_id)
 
-    # Returns workspace path but does NOT write the file
-    assert out_path is not None
+    # Returns workspace path but does NOT rewrite the file
+    assert out_path == MEMEX_PATH
+    assert MEMEX_PATH.read_text(encoding="utf-8") == before
     assert not (tmp_path / "MEMEX.md").exists()
 
 
@@ -72,7 +97,41 @@ def test_distribute_memex_returns_none_for_empty_or_placeholder_content(
     assert not (tmp_path / "MEMEX.md").exists()
 
 
+def test_distribute_all_memex_matches_per_user_results(
+    db: SykeDB,
+    tmp_path: Path,
+    memex_template: Memory,
+) -> None:
+    """The batched fan-out agrees with per-user distribute_memex."""
+    db.insert_memories(
+        [
+            memex_template.model_copy(
+                update={
+                    "id": "memex-alice",
+                    "user_id": "alice",
+                    "content": "# Memex — alice\n\n## Identity\nAlice.",
+                }
+            ),
+            memex_template.model_copy(
+                update={
+                    "id": "memex-bob",
+                    "user_id": "bob",
+                    "content": "[No memex yet. 3 memories are available in Syke's canonical database.]",
+                }
+            ),
+        ]
+    )
+
+    results = distribute_all_memex(db)
+
+    assert set(results) == {"alice", "bob"}
+    assert results["alice"] == distribute_memex(db, "alice")
+    assert results["bob"] is None
+
+
 def test_install_skill_installs_only_to_detected_platforms(tmp_path: Path) -> None:
+    from syke.distribution.context_files import install_skill
+
     agents_dir = tmp_path / ".agents"
     claude_dir = tmp_path / ".claude"
     gemini_dir = tmp_path / ".gemini"
@@ -123,12 +182,13 @@ def test_install_skill_installs_only_to_detected_platforms(tmp_path: Path) -> No
     assert (copilot_dir / "agents" / "syke.agent.md").exists()
     assert (antigravity_workflows_dir / "syke.md").exists()
     skill_text = (claude_dir / "skills" / "syke" / "SKILL.md").read_text()
-    assert "~/.syke/MEMEX.md" in skill_text
-    assert f"version: {syke.__version__}" in skill_text
-    assert "Node.js 20+ (22 LTS recommended)" in skill_text
+    assert set(_SKILL_CONTRACT_RE.findall(skill_text)) == set(_SKILL_CONTRACT_FRAGMENTS)
 
 
 def test_packaged_skill_matches_repo_skill_contract() -> None:
+    from syke.config import PROJECT_ROOT
+    from syke.distribution.context_files import _get_skill_content
+
     repo_skill = (PROJECT_ROOT / "SKILL.md").read_text(encoding="utf-8")
     assert _get_skill_content() == repo_skill
     assert f"version: {syke.__version__}" in repo_skill
@@ -139,6 +199,8 @@ def test_refresh_distribution_orchestrates_exports(
     user_id: str,
     tmp_path: Path,
 ) -> None:
+    from syke.distribution import refresh_distribution
+
     memex_path = tmp_path / "data" / "MEMEX.md"
     memex_path.parent.mkdir(parents=True)
     skill_path = tmp_path / ".codex" / "skills" / "syke" / "SKILL.md"
@@ -165,6 +227,8 @@ def test_refresh_distribution_installs_skill_even_without_memex(
     user_id: str,
     tmp_path: Path,
 ) -> None:
+    from syke.distribution import refresh_distribution
+
     with (
         patch("syke.distribution.distribute_memex", return_value=None),
         patch("syke.distribution.install_skill", return_value=[]),
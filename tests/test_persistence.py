@@ -7,6 +7,15 @@ from pathlib import Path
 from syke.db import SykeDB
 from syke.models import Memory
 
+# Built once at import; tests derive memex rows via model_copy(update=...),
+# which skips validator reruns on the unchanged fields.
+_MEMEX_TEMPLATE = Memory(
+    id="memex-template",
+    user_id="template",
+    content="",
+    source_event_ids=["__memex__"],
+)
+
 
 def _memory_row(db: SykeDB, user_id: str, memory_id: str) -> dict | None:
     row = db.conn.execute(
@@ -94,23 +103,35 @@ def test_active_flag_can_retire_memory_row(db, user_id):
 
 
 def test_memory_isolation(db):
-    db.insert_memory(Memory(id="iso1", user_id="alice", content="Alice"))
-    db.insert_memory(Memory(id="iso2", user_id="bob", content="Bob"))
+    db.insert_memories(
+        [
+            Memory(id="iso1", user_id="alice", content="Alice"),
+            Memory(id="iso2", user_id="bob", content="Bob"),
+        ]
+    )
     assert _memory_row(db, "alice", "iso2") is None
     assert db.count_memories("alice") == 1
 
 
 def test_fts_search_reads_active_memory_rows(db, user_id):
-    db.insert_memory(Memory(id="s1", user_id=user_id, content="Syke is an agentic memory system"))
-    db.insert_memory(Memory(id="s2", user_id=user_id, content="Python programming"))
-    db.insert_memory(Memory(id="s3", user_id=user_id, content="Memory and identity are the same"))
+    db.insert_memories(
+        [
+            Memory(id="s1", user_id=user_id, content="Syke is an agentic memory system"),
+            Memory(id="s2", user_id=user_id, content="Python programming"),
+            Memory(id="s3", user_id=user_id, content="Memory and identity are the same"),
+        ]
+    )
     ids = set(_search_memory_ids(db, user_id, "memory"))
     assert "s1" in ids and "s3" in ids
 
 
 def test_fts_search_excludes_inactive_memory_rows(db, user_id):
-    db.insert_memory(Memory(id="act", user_id=user_id, content="Active memory about Syke"))
-    db.insert_memory(Memory(id="inact", user_id=user_id, content="Inactive memory about Syke"))
+    db.insert_memories(
+        [
+            Memory(id="act", user_id=user_id, content="Active memory about Syke"),
+            Memory(id="inact", user_id=user_id, content="Inactive memory about Syke"),
+        ]
+    )
     db.conn.execute(
         "UPDATE memories SET active = 0 WHERE user_id = ? AND id = ?",
         (user_id, "inact"),
@@ -121,8 +142,12 @@ def test_fts_search_excludes_inactive_memory_rows(db, user_id):
 
 
 def test_links_bidirectional(db, user_id):
-    db.insert_memory(Memory(id="ba", user_id=user_id, content="A"))
-    db.insert_memory(Memory(id="bb", user_id=user_id, content="B"))
+    db.insert_memories(
+        [
+            Memory(id="ba", user_id=user_id, content="A"),
+            Memory(id="bb", user_id=user_id, content="B"),
+        ]
+    )
     db.conn.execute(
         """INSERT INTO links (id, user_id, source_id, target_id, reason, created_at)
            VALUES (?, ?, ?, ?, ?, ?)""",
@@ -147,21 +172,15 @@ def test_update_memex(db, user_id):
 def test_update_memex_collapses_duplicate_active_memex_rows(db, user_id):
     from syke.memory.memex import update_memex
 
-    db.insert_memory(
-        Memory(
-            id="memex-older",
-            user_id=user_id,
-            content="older",
-            source_event_ids=["__memex__"],
-        )
-    )
-    db.insert_memory(
-        Memory(
-            id="memex-newer",
-            user_id=user_id,
-            content="newer",
-            source_event_ids=["__memex__"],
-        )
+    db.insert_memories(
+        [
+            _MEMEX_TEMPLATE.model_copy(
+                update={"id": "memex-older", "user_id": user_id, "content": "older"}
+            ),
+            _MEMEX_TEMPLATE.model_copy(
+                update={"id": "memex-newer", "user_id": user_id, "content": "newer"}
+            ),
+        ]
     )
 
     new_id = update_memex(db, user_id, "canonical")
@@ -184,23 +203,25 @@ def test_update_memex_collapses_duplicate_active_without_receipt(db, user_id):
 
     from syke.memory.memex import update_memex
 
-    db.insert_memory(
-        Memory(
-            id="memex-older",
-            user_id=user_id,
-            content="canonical",
-            source_event_ids=["__memex__"],
-            created_at=datetime(2026, 5, 9, 12, 0, tzinfo=UTC),
-        )
-    )
-    db.insert_memory(
-        Memory(
-            id="memex-newer",
-            user_id=user_id,
-            content="canonical",
-            source_event_ids=["__memex__"],
-            created_at=datetime(2026, 5, 9, 13, 0, tzinfo=UTC),
-        )
+    db.insert_memories(
+        [
+            _MEMEX_TEMPLATE.model_copy(
+                update={
+                    "id": "memex-older",
+                    "user_id": user_id,
+                    "content": "canonical",
+                    "created_at": datetime(2026, 5, 9, 12, 0, tzinfo=UTC),
+                }
+            ),
+            _MEMEX_TEMPLATE.model_copy(
+                update={
+                    "id": "memex-newer",
+                    "user_id": user_id,
+                    "content": "canonical",
+                    "created_at": datetime(2026, 5, 9, 13, 0, tzinfo=UTC),
+                }
+            ),
+        ]
     )
 
     kept_id = update_memex(db, user_id, "canonical")
@@ -260,23 +281,23 @@ def test_get_memex_for_injection_no_data_fallback(db, user_id):
     assert "syke status --json" in result
 
 
-def test_insert_memory_standalone_commits(db, user_id):
+def test_insert_memory_standalone_commits(db_file, user_id):
     mem = Memory(id="m-standalone", user_id=user_id, content="standalone commit test")
-    mid = db.insert_memory(mem)
-    db2 = SykeDB(db.db_path)
+    mid = db_file.insert_memory(mem)
+    db2 = SykeDB(db_file.db_path)
     row = _memory_row(db2, user_id, mid)
     db2.close()
     assert row is not None
     assert row["content"] == "standalone commit test"
 
 
-def test_insert_memory_in_transaction_defers(db, user_id):
+def test_insert_memory_in_transaction_defers(db_file, user_id):
     import sqlite3 as _sqlite3
 
-    with db.transaction():
+    with db_file.transaction():
         mem = Memory(id="m-txn-defer", user_id=user_id, content="in-txn memory")
-        mid = db.insert_memory(mem)
-        conn2 = _sqlite3.connect(db.db_path, timeout=1)
+        mid = db_file.insert_memory(mem)
+        conn2 = _sqlite3.connect(db_file.db_path, timeout=1)
         conn2.row_factory = _sqlite3.Row
         row = conn2.execute(
             "SELECT * FROM memories WHERE user_id = ? AND id = ?",
@@ -284,7 +305,7 @@ def test_insert_memory_in_transaction_defers(db, user_id):
         ).fetchone()
         conn2.close()
         assert row is None
-    db3 = SykeDB(db.db_path)
+    db3 = SykeDB(db_file.db_path)
     row = _memory_row(db3, user_id, mid)
     db3.close()
     assert row is not None
@@ -483,46 +504,46 @@ def test_fts5_trigger_on_supersession_update(db, user_id):
     assert "fts-sup-new" in ids
 
 
-def test_link_insert_in_transaction_defers(db, user_id):
-    """Direct link-row inserts must defer commit inside db.transaction()."""
+def test_link_insert_in_transaction_defers(db_file, user_id):
+    """Direct link-row inserts must defer commit inside db_file.transaction()."""
     import sqlite3 as _sqlite3
 
-    db.insert_memory(Memory(id="link-a", user_id=user_id, content="A"))
-    db.insert_memory(Memory(id="link-b", user_id=user_id, content="B"))
+    db_file.insert_memory(Memory(id="link-a", user_id=user_id, content="A"))
+    db_file.insert_memory(Memory(id="link-b", user_id=user_id, content="B"))
 
-    with db.transaction():
-        db.conn.execute(
+    with db_file.transaction():
+        db_file.conn.execute(
             """INSERT INTO links (id, user_id, source_id, target_id, reason, created_at)
                VALUES (?, ?, ?, ?, ?, ?)""",
             ("txn-link", user_id, "link-a", "link-b", "test", "2026-01-01T00:00:00+00:00"),
         )
-        conn2 = _sqlite3.connect(db.db_path, timeout=1)
+        conn2 = _sqlite3.connect(db_file.db_path, timeout=1)
         row = conn2.execute("SELECT * FROM links WHERE id = ?", ("txn-link",)).fetchone()
         conn2.close()
         assert row is None
 
-    conn3 = _sqlite3.connect(db.db_path, timeout=1)
+    conn3 = _sqlite3.connect(db_file.db_path, timeout=1)
     row = conn3.execute("SELECT * FROM links WHERE id = ?", ("txn-link",)).fetchone()
     conn3.close()
     assert row is not None
 
 
-def test_transaction_reentrant(db, user_id):
+def test_transaction_reentrant(db_file, user_id):
     """Nested transaction() calls pass through — outermost controls commit."""
     import sqlite3 as _sqlite3
 
     from syke.memory.memex import update_memex
 
-    with db.transaction():
-        db.insert_memory(Memory(id="outer", user_id=user_id, content="outer"))
-        memex_id = update_memex(db, user_id, "inner memex")
+    with db_file.transaction():
+        db_file.insert_memory(Memory(id="outer", user_id=user_id, content="outer"))
+        memex_id = update_memex(db_file, user_id, "inner memex")
 
-        conn2 = _sqlite3.connect(db.db_path, timeout=1)
+        conn2 = _sqlite3.connect(db_file.db_path, timeout=1)
         row = conn2.execute("SELECT * FROM memories WHERE id = ?", ("outer",)).fetchone()
         memex_row = conn2.execute("SELECT * FROM memories WHERE id = ?", (memex_id,)).fetchone()
         conn2.close()
         assert row is None
         assert memex_row is None
 
-    assert _memory_row(db, user_id, "outer") is not None
-    assert _memory_row(db, user_id, memex_id) is not None
+    assert _memory_row(db_file, user_id, "outer") is not None
+    assert _memory_row(db_file, user_id, memex_id) is not None